@@ -1,23 +1,29 @@
 from __future__ import annotations
 
-import json
 import os
+from functools import cached_property
+
+import orjson
+
+_ENV: dict[str, str] = dict(os.environ)
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
 
 
 def _read_bool(name: str, default: bool = False) -> bool:
-    raw = os.getenv(name)
+    raw = _ENV.get(name)
     if raw is None:
         return default
-    return raw.strip().lower() in {"1", "true", "yes", "on"}
+    value = raw.strip()
+    return len(value) <= 4 and value.lower() in _TRUTHY
 
 
 def _read_json_dict(name: str) -> dict[str, str]:
-    raw = os.getenv(name, "").strip()
+    raw = _ENV.get(name, "").strip()
     if not raw:
         return {}
     try:
-        parsed = json.loads(raw)
-    except json.JSONDecodeError:
+        parsed = orjson.loads(raw)
+    except orjson.JSONDecodeError:
         return {}
     if not isinstance(parsed, dict):
         return {}
@@ -25,47 +31,176 @@ def _read_json_dict(name: str) -> dict[str, str]:
 
 
 class Settings:
-    parser_service_url: str = os.getenv("PARSER_SERVICE_URL", "http://127.0.0.1:8102")
-    graph_service_url: str = os.getenv("GRAPH_SERVICE_URL", "http://127.0.0.1:8103")
-    suggestion_service_url: str = os.getenv("SUGGESTION_SERVICE_URL", "http://127.0.0.1:8104")
-
-    default_tenant_id: str = os.getenv("DEFAULT_TENANT_ID", "public")
-    auth_required: bool = _read_bool("AUTH_REQUIRED", default=False)
-    auth_mode: str = os.getenv("AUTH_MODE", "none")
-    tenant_api_keys: dict[str, str] = _read_json_dict("TENANT_API_KEYS_JSON")
-    jwt_secret: str = os.getenv("JWT_SECRET", "dev-only-secret-change-me")
-    jwt_algorithm: str = os.getenv("JWT_ALGORITHM", "HS256")
-    jwt_audience: str | None = os.getenv("JWT_AUDIENCE")
-    jwt_issuer: str | None = os.getenv("JWT_ISSUER")
-
-    content_encryption_key: str | None = os.getenv("CONTENT_ENCRYPTION_KEY")
-
-    parser_backend: str = os.getenv("PARSER_BACKEND", "transformer")
-    transformer_inference_url: str | None = os.getenv("TRANSFORMER_INFERENCE_URL")
-    transformer_timeout_seconds: float = float(os.getenv("TRANSFORMER_TIMEOUT_SECONDS", "5.0"))
-
-    graph_backend: str = os.getenv("GRAPH_BACKEND", "memory")
-    neo4j_uri: str = os.getenv("NEO4J_URI", "bolt://127.0.0.1:7687")
-    neo4j_username: str = os.getenv("NEO4J_USERNAME", "neo4j")
-    neo4j_password: str = os.getenv("NEO4J_PASSWORD", "password")
-    elasticsearch_url: str = os.getenv("ELASTICSEARCH_URL", "http://127.0.0.1:9200")
-    elasticsearch_index_name: str = os.getenv("ELASTICSEARCH_INDEX_NAME", "opentree-evidence")
-
-    event_bus_backend: str = os.getenv("EVENT_BUS_BACKEND", "inmemory")
-    event_bus_consumer_group: str = os.getenv("EVENT_BUS_CONSUMER_GROUP", "dialogue-service")
-    redis_url: str = os.getenv("REDIS_URL", "redis://127.0.0.1:6379/0")
-    redis_stream_prefix: str = os.getenv("REDIS_STREAM_PREFIX", "opentree")
-    async_pipeline_enabled: bool = _read_bool("ASYNC_PIPELINE_ENABLED", default=False)
-    async_retry_max_attempts: int = int(os.getenv("ASYNC_RETRY_MAX_ATTEMPTS", "3"))
-    async_retry_base_delay_seconds: float = float(os.getenv("ASYNC_RETRY_BASE_DELAY_SECONDS", "0.25"))
-    async_job_ttl_seconds: int = int(os.getenv("ASYNC_JOB_TTL_SECONDS", "86400"))
-
-    session_store_backend: str = os.getenv("SESSION_STORE_BACKEND", "memory")
-    job_store_backend: str = os.getenv("JOB_STORE_BACKEND", "memory")
-    postgres_dsn: str = os.getenv(
-        "POSTGRES_DSN",
-        "dbname=opentree user=opentree password=opentree host=127.0.0.1 port=5432",
-    )
+    # Every field is resolved from the environment snapshot on first access
+    # and cached on the instance; `reload()` drops the cached values.
+    @cached_property
+    def parser_service_url(self) -> str:
+        return _ENV.get("PARSER_SERVICE_URL", "http://127.0.0.1:8102")
+
+    @cached_property
+    def graph_service_url(self) -> str:
+        return _ENV.get("GRAPH_SERVICE_URL", "http://127.0.0.1:8103")
+
+    @cached_property
+    def suggestion_service_url(self) -> str:
+        return _ENV.get("SUGGESTION_SERVICE_URL", "http://127.0.0.1:8104")
+
+    @cached_property
+    def default_tenant_id(self) -> str:
+        return _ENV.get("DEFAULT_TENANT_ID", "public")
+
+    @cached_property
+    def auth_required(self) -> bool:
+        return _read_bool("AUTH_REQUIRED", default=False)
+
+    @cached_property
+    def auth_mode(self) -> str:
+        return _ENV.get("AUTH_MODE", "none")
+
+    @cached_property
+    def tenant_api_keys(self) -> dict[str, str]:
+        return _read_json_dict("TENANT_API_KEYS_JSON")
+
+    @cached_property
+    def jwt_secret(self) -> str:
+        return _ENV.get("JWT_SECRET", "dev-only-secret-change-me")
+
+    @cached_property
+    def jwt_algorithm(self) -> str:
+        return _ENV.get("JWT_ALGORITHM", "HS256")
+
+    @cached_property
+    def jwt_audience(self) -> str | None:
+        return _ENV.get("JWT_AUDIENCE")
+
+    @cached_property
+    def jwt_issuer(self) -> str | None:
+        return _ENV.get("JWT_ISSUER")
+
+    @cached_property
+    def content_encryption_key(self) -> str | None:
+        return _ENV.get("CONTENT_ENCRYPTION_KEY")
+
+    @cached_property
+    def parser_backend(self) -> str:
+        return _ENV.get("PARSER_BACKEND", "transformer")
+
+    @cached_property
+    def transformer_inference_url(self) -> str | None:
+        return _ENV.get("TRANSFORMER_INFERENCE_URL")
+
+    @cached_property
+    def transformer_timeout_seconds(self) -> float:
+        return float(_ENV.get("TRANSFORMER_TIMEOUT_SECONDS", "5.0"))
+
+    @cached_property
+    def parser_batch_max(self) -> int:
+        return int(_ENV.get("PARSER_BATCH_MAX", "1"))
+
+    @cached_property
+    def parser_batch_window_ms(self) -> float:
+        return float(_ENV.get("PARSER_BATCH_WINDOW_MS", "5"))
+
+    @cached_property
+    def parser_session_memory_max(self) -> int:
+        return int(_ENV.get("PARSER_SESSION_MEMORY_MAX", "10000"))
+
+    @cached_property
+    def parser_cache_enabled(self) -> bool:
+        return _read_bool("PARSER_CACHE_ENABLED", default=False)
+
+    @cached_property
+    def graph_backend(self) -> str:
+        return _ENV.get("GRAPH_BACKEND", "memory")
+
+    @cached_property
+    def neo4j_uri(self) -> str:
+        return _ENV.get("NEO4J_URI", "bolt://127.0.0.1:7687")
+
+    @cached_property
+    def neo4j_username(self) -> str:
+        return _ENV.get("NEO4J_USERNAME", "neo4j")
+
+    @cached_property
+    def neo4j_password(self) -> str:
+        return _ENV.get("NEO4J_PASSWORD", "password")
+
+    @cached_property
+    def elasticsearch_url(self) -> str:
+        return _ENV.get("ELASTICSEARCH_URL", "http://127.0.0.1:9200")
+
+    @cached_property
+    def elasticsearch_index_name(self) -> str:
+        return _ENV.get("ELASTICSEARCH_INDEX_NAME", "opentree-evidence")
+
+    @cached_property
+    def es_bulk_chunk_size(self) -> int:
+        return int(_ENV.get("ES_BULK_CHUNK_SIZE", "500"))
+
+    @cached_property
+    def es_bulk_max_bytes(self) -> int:
+        return int(_ENV.get("ES_BULK_MAX_BYTES", str(5 * 1024 * 1024)))
+
+    @cached_property
+    def es_queue_max_actions(self) -> int:
+        return int(_ENV.get("ES_QUEUE_MAX_ACTIONS", "10000"))
+
+    @cached_property
+    def event_bus_backend(self) -> str:
+        return _ENV.get("EVENT_BUS_BACKEND", "inmemory")
+
+    @cached_property
+    def event_bus_consumer_group(self) -> str:
+        return _ENV.get("EVENT_BUS_CONSUMER_GROUP", "dialogue-service")
+
+    @cached_property
+    def redis_url(self) -> str:
+        return _ENV.get("REDIS_URL", "redis://127.0.0.1:6379/0")
+
+    @cached_property
+    def redis_stream_prefix(self) -> str:
+        return _ENV.get("REDIS_STREAM_PREFIX", "opentree")
+
+    @cached_property
+    def async_pipeline_enabled(self) -> bool:
+        return _read_bool("ASYNC_PIPELINE_ENABLED", default=False)
+
+    @cached_property
+    def async_retry_max_attempts(self) -> int:
+        return int(_ENV.get("ASYNC_RETRY_MAX_ATTEMPTS", "3"))
+
+    @cached_property
+    def async_retry_base_delay_seconds(self) -> float:
+        return float(_ENV.get("ASYNC_RETRY_BASE_DELAY_SECONDS", "0.25"))
+
+    @cached_property
+    def async_job_ttl_seconds(self) -> int:
+        return int(_ENV.get("ASYNC_JOB_TTL_SECONDS", "86400"))
+
+    @cached_property
+    def async_worker_concurrency(self) -> int:
+        return int(_ENV.get("ASYNC_WORKER_CONCURRENCY", "8"))
+
+    @cached_property
+    def session_store_backend(self) -> str:
+        return _ENV.get("SESSION_STORE_BACKEND", "memory")
+
+    @cached_property
+    def job_store_backend(self) -> str:
+        return _ENV.get("JOB_STORE_BACKEND", "memory")
+
+    @cached_property
+    def postgres_dsn(self) -> str:
+        return _ENV.get(
+            "POSTGRES_DSN",
+            "dbname=opentree user=opentree password=opentree host=127.0.0.1 port=5432",
+        )
+
+    @classmethod
+    def reload(cls) -> None:
+        global _ENV
+        _ENV = dict(os.environ)
+        settings.__dict__.clear()
 
 
 settings = Settings()
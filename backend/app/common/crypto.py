@@ -20,17 +20,23 @@ class ContentCipher:
         return self._fernet is not None
 
     def encrypt(self, plaintext: str) -> str:
-        if not self._fernet:
-            return plaintext
-        return self._fernet.encrypt(plaintext.encode("utf-8")).decode("utf-8")
+        return self.encrypt_bytes(plaintext).decode("utf-8")
 
     def decrypt(self, ciphertext: str) -> str:
-        if not self._fernet:
-            return ciphertext
+        return self.decrypt_bytes(ciphertext.encode("utf-8"))
+
+    def encrypt_bytes(self, plaintext: str) -> bytes:
+        if self._fernet is None:
+            return plaintext.encode("utf-8")
+        return self._fernet.encrypt(plaintext.encode("utf-8"))
+
+    def decrypt_bytes(self, ciphertext: bytes) -> str:
+        if self._fernet is None:
+            return ciphertext.decode("utf-8")
         try:
-            return self._fernet.decrypt(ciphertext.encode("utf-8")).decode("utf-8")
+            return self._fernet.decrypt(ciphertext).decode("utf-8")
         except InvalidToken:
-            return ciphertext
+            return ciphertext.decode("utf-8")
 
 
 def build_content_cipher() -> ContentCipher:
@@ -1,19 +1,22 @@
 from __future__ import annotations
 
-import json
 import threading
-import time
-from collections import defaultdict, deque
 from dataclasses import dataclass
+from queue import Empty, SimpleQueue
 from typing import Any
 from uuid import uuid4
 
+import orjson
+from pydantic import BaseModel
+
 from app.common.config import settings
 
 try:
     from redis import Redis
+    from redis.exceptions import ResponseError
 except Exception:  # pragma: no cover - optional dependency fallback
     Redis = None  # type: ignore[assignment]
+    ResponseError = Exception  # type: ignore[assignment,misc]
 
 
 @dataclass
@@ -28,6 +31,11 @@ class EventBus:
     def publish(self, topic: str, payload: dict[str, Any], key: str | None = None) -> str:
         raise NotImplementedError
 
+    def publish_model(self, topic: str, model: BaseModel, key: str | None = None) -> str:
+        # Unset optional fields are left out so consumers see the same
+        # payload shape as a hand-built dict.
+        return self.publish(topic, model.model_dump(mode="json", exclude_none=True), key=key)
+
     def consume(
         self,
         topic: str,
@@ -41,17 +49,42 @@ class EventBus:
     def ack(self, topic: str, consumer_group: str, messages: list[EventEnvelope]) -> None:
         raise NotImplementedError
 
+    def is_ready(self) -> tuple[bool, str]:
+        raise NotImplementedError
+
+
+class _Shard:
+    __slots__ = ("topics", "lock")
 
-class InMemoryEventBus(EventBus):
     def __init__(self) -> None:
-        self._topics: dict[str, deque[EventEnvelope]] = defaultdict(deque)
-        self._lock = threading.Lock()
+        self.topics: dict[str, SimpleQueue[EventEnvelope]] = {}
+        self.lock = threading.Lock()
+
+    def queue(self, topic: str) -> SimpleQueue[EventEnvelope]:
+        # The lock only guards topic creation; SimpleQueue is safe for
+        # concurrent put/get on its own.
+        queue = self.topics.get(topic)
+        if queue is None:
+            with self.lock:
+                queue = self.topics.setdefault(topic, SimpleQueue())
+        return queue
+
+
+class InMemoryEventBus(EventBus):
+    def __init__(self, shards: int = 8) -> None:
+        if shards < 1:
+            raise ValueError("shards must be >= 1")
+        # Topics are spread over independent shards so creating topics from
+        # many threads does not serialize on a single dict and lock.
+        self._shards = [_Shard() for _ in range(shards)]
+
+    def _queue(self, topic: str) -> SimpleQueue[EventEnvelope]:
+        return self._shards[hash(topic) % len(self._shards)].queue(topic)
 
     def publish(self, topic: str, payload: dict[str, Any], key: str | None = None) -> str:
         message_id = uuid4().hex
         envelope = EventEnvelope(message_id=message_id, topic=topic, key=key, payload=payload)
-        with self._lock:
-            self._topics[topic].append(envelope)
+        self._queue(topic).put(envelope)
         return message_id
 
     def consume(
@@ -64,18 +97,25 @@ class InMemoryEventBus(EventBus):
     ) -> list[EventEnvelope]:
         del consumer_group, consumer_name
         out: list[EventEnvelope] = []
-        with self._lock:
-            queue = self._topics[topic]
-            for _ in range(min(count, len(queue))):
-                out.append(queue.popleft())
-        if not out and block_ms > 0:
-            time.sleep(block_ms / 1000.0)
+        queue = self._queue(topic)
+        try:
+            # Wait on the queue itself so a publish wakes the consumer
+            # immediately instead of after a fixed sleep.
+            if block_ms > 0:
+                out.append(queue.get(timeout=block_ms / 1000.0))
+            while len(out) < count:
+                out.append(queue.get_nowait())
+        except Empty:
+            pass
         return out
 
     def ack(self, topic: str, consumer_group: str, messages: list[EventEnvelope]) -> None:
         del topic, consumer_group, messages
         return None
 
+    def is_ready(self) -> tuple[bool, str]:
+        return True, "inmemory event bus ready"
+
 
 class RedisStreamEventBus(EventBus):
     def __init__(self, redis_url: str, stream_prefix: str) -> None:
@@ -91,22 +131,33 @@ class RedisStreamEventBus(EventBus):
 
     def _ensure_group(self, stream_name: str, consumer_group: str) -> None:
         key = (stream_name, consumer_group)
+        # Set membership reads are atomic under the GIL, so the steady-state
+        # path skips the lock; creation is still serialized below.
+        if key in self._group_ready:
+            return
         with self._lock:
             if key in self._group_ready:
                 return
             try:
                 self._redis.xgroup_create(stream_name, consumer_group, id="$", mkstream=True)
-            except Exception as exc:
-                if "BUSYGROUP" not in str(exc):
+            except ResponseError as exc:
+                message = exc.args[0] if exc.args else ""
+                if not (isinstance(message, str) and message.startswith("BUSYGROUP")):
                     raise
             self._group_ready.add(key)
 
-    def publish(self, topic: str, payload: dict[str, Any], key: str | None = None) -> str:
-        stream_name = self._stream_name(topic)
-        body = {"payload": json.dumps(payload)}
+    def _xadd(self, topic: str, encoded_payload: str, key: str | None) -> str:
+        body = {"payload": encoded_payload}
         if key:
             body["key"] = key
-        return str(self._redis.xadd(stream_name, fields=body))
+        return str(self._redis.xadd(self._stream_name(topic), fields=body))
+
+    def publish(self, topic: str, payload: dict[str, Any], key: str | None = None) -> str:
+        return self._xadd(topic, orjson.dumps(payload).decode(), key)
+
+    def publish_model(self, topic: str, model: BaseModel, key: str | None = None) -> str:
+        # pydantic-core writes the stream payload directly, skipping the dict.
+        return self._xadd(topic, model.model_dump_json(exclude_none=True), key)
 
     def consume(
         self,
@@ -114,7 +165,7 @@ class RedisStreamEventBus(EventBus):
         consumer_group: str,
         consumer_name: str,
         count: int = 20,
-        block_ms: int = 1000,
+        block_ms: int = 30000,
     ) -> list[EventEnvelope]:
         stream_name = self._stream_name(topic)
         self._ensure_group(stream_name, consumer_group)
@@ -129,7 +180,7 @@ class RedisStreamEventBus(EventBus):
         out: list[EventEnvelope] = []
         for _, entries in rows:
             for message_id, fields in entries:
-                payload = json.loads(fields.get("payload", "{}"))
+                payload = orjson.loads(fields.get("payload", "{}"))
                 key = fields.get("key")
                 out.append(EventEnvelope(message_id=message_id, topic=topic, key=key, payload=payload))
         return out
@@ -140,6 +191,13 @@ class RedisStreamEventBus(EventBus):
         stream_name = self._stream_name(topic)
         self._redis.xack(stream_name, consumer_group, *[m.message_id for m in messages])
 
+    def is_ready(self) -> tuple[bool, str]:
+        try:
+            self._redis.ping()
+            return True, "redis event bus ready"
+        except Exception as exc:
+            return False, f"redis event bus not ready: {exc}"
+
 
 def build_event_bus() -> EventBus:
     if settings.event_bus_backend.lower() == "redis":
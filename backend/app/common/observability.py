@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+import itertools
 import logging
+import secrets
 import time
-from uuid import uuid4
 
 from fastapi import FastAPI, Request, Response
 
 LOGGER = logging.getLogger("opentree")
 
+# Request ids are a random per-process prefix plus a counter, which keeps them
+# unique without drawing from urandom on every request.
+_REQ_PREFIX = secrets.token_hex(4)
+_REQ_COUNTER = itertools.count()
+
 
 def configure_logging() -> None:
     if LOGGER.handlers:
@@ -23,31 +29,34 @@ def install_request_metrics_middleware(app: FastAPI) -> None:
 
     @app.middleware("http")
     async def request_metrics(request: Request, call_next):  # type: ignore[no-untyped-def]
-        request_id = request.headers.get("X-Request-ID", uuid4().hex)
+        request_id = request.headers.get("X-Request-ID") or f"{_REQ_PREFIX}{next(_REQ_COUNTER):x}"
+        method = request.method
+        path = request.url.path
         started_at = time.perf_counter()
         response: Response
         try:
             response = await call_next(request)
         except Exception:
-            duration_ms = (time.perf_counter() - started_at) * 1000
             LOGGER.exception(
                 "request_failed request_id=%s method=%s path=%s duration_ms=%.2f",
                 request_id,
-                request.method,
-                request.url.path,
-                duration_ms,
+                method,
+                path,
+                (time.perf_counter() - started_at) * 1000,
             )
             raise
 
-        duration_ms = (time.perf_counter() - started_at) * 1000
-        response.headers["X-Request-ID"] = request_id
-        response.headers["X-Process-Time-MS"] = f"{duration_ms:.2f}"
-        LOGGER.info(
-            "request_completed request_id=%s method=%s path=%s status=%s duration_ms=%.2f",
-            request_id,
-            request.method,
-            request.url.path,
-            response.status_code,
-            duration_ms,
-        )
+        duration_ms = format((time.perf_counter() - started_at) * 1000, ".2f")
+        headers = response.headers
+        headers["X-Request-ID"] = request_id
+        headers["X-Process-Time-MS"] = duration_ms
+        if LOGGER.isEnabledFor(logging.INFO):
+            LOGGER.info(
+                "request_completed request_id=%s method=%s path=%s status=%s duration_ms=%s",
+                request_id,
+                method,
+                path,
+                response.status_code,
+                duration_ms,
+            )
         return response
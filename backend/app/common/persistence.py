@@ -1,25 +1,38 @@
 from __future__ import annotations
 
-import json
-from dataclasses import dataclass
+import threading
+import weakref
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
+import orjson
+from pydantic import TypeAdapter
+
 from app.common.config import settings
 from app.common.schemas import AsyncTurnJobResponse, Session, Speaker, Turn
 
 try:
     import psycopg2
-    from psycopg2.extras import Json
+    from psycopg2.extras import Json, execute_values
+    from psycopg2.pool import ThreadedConnectionPool
 except Exception:  # pragma: no cover - optional dependency fallback
     psycopg2 = None  # type: ignore[assignment]
     Json = None  # type: ignore[assignment]
+    execute_values = None  # type: ignore[assignment]
+    ThreadedConnectionPool = None  # type: ignore[assignment]
 
 try:
     from redis import Redis
 except Exception:  # pragma: no cover - optional dependency fallback
     Redis = None  # type: ignore[assignment]
 
+_JOB_ADAPTER: TypeAdapter[AsyncTurnJobResponse] = TypeAdapter(AsyncTurnJobResponse)
+_SPEAKER_BY_VALUE: dict[str, Speaker] = {speaker.value: speaker for speaker in Speaker}
+_SPEAKER_TO_VALUE: dict[Speaker, str] = {speaker: speaker.value for speaker in Speaker}
+
 
 @dataclass
 class StoredTurnRecord:
@@ -29,7 +42,14 @@ class StoredTurnRecord:
     speaker: Speaker
     parent_turn_id: str | None
     created_at: datetime
-    content_ciphertext: str
+    content_ciphertext: bytes
+
+
+@dataclass
+class TurnMetadata:
+    turn_id: str
+    speaker: Speaker
+    parent_turn_id: str | None
 
 
 class SessionStore:
@@ -39,10 +59,22 @@ class SessionStore:
     def get_session(self, tenant_id: str, session_id: str) -> Session | None:
         raise NotImplementedError
 
-    def append_turn(self, turn: Turn, content_ciphertext: str) -> None:
+    def append_turn(self, turn: Turn, content_ciphertext: bytes) -> None:
+        raise NotImplementedError
+
+    def append_turns(self, items: list[tuple[Turn, bytes]]) -> None:
         raise NotImplementedError
 
-    def list_turns(self, tenant_id: str, session_id: str) -> list[StoredTurnRecord]:
+    def list_turns(self, tenant_id: str, session_id: str, limit: int | None = None) -> list[StoredTurnRecord]:
+        # Returns turns oldest first; `limit` keeps only the most recent ones.
+        raise NotImplementedError
+
+    def list_turn_window(self, tenant_id: str, session_id: str, turn_id: str, limit: int) -> list[StoredTurnRecord]:
+        # Returns up to `limit` turns preceding `turn_id` followed by that turn,
+        # oldest first; empty when the turn does not exist.
+        raise NotImplementedError
+
+    def list_turn_metadata(self, tenant_id: str, session_id: str) -> list[TurnMetadata]:
         raise NotImplementedError
 
     def is_ready(self) -> tuple[bool, str]:
@@ -63,57 +95,131 @@ class JobStore:
         raise NotImplementedError
 
 
+@dataclass
+class _TurnColumns:
+    turn_ids: list[str] = field(default_factory=list)
+    speakers: list[Speaker] = field(default_factory=list)
+    parent_turn_ids: list[str | None] = field(default_factory=list)
+    created_ats: list[datetime] = field(default_factory=list)
+    content_ciphertexts: list[bytes] = field(default_factory=list)
+
+    def append(self, turn: Turn, content_ciphertext: bytes) -> None:
+        self.turn_ids.append(turn.turn_id)
+        self.speakers.append(turn.speaker)
+        self.parent_turn_ids.append(turn.parent_turn_id)
+        self.created_ats.append(turn.created_at)
+        self.content_ciphertexts.append(content_ciphertext)
+
+
 class MemorySessionStore(SessionStore):
     def __init__(self) -> None:
-        self._sessions: dict[str, Session] = {}
-        self._turns: dict[str, list[StoredTurnRecord]] = {}
-
-    @staticmethod
-    def _scope_key(tenant_id: str, session_id: str) -> str:
-        return f"{tenant_id}:{session_id}"
+        self._sessions: dict[tuple[str, str], Session] = {}
+        self._turns: dict[tuple[str, str], _TurnColumns] = {}
 
     def create_session(self, session: Session) -> None:
-        self._sessions[self._scope_key(session.tenant_id, session.session_id)] = session
+        self._sessions[(session.tenant_id, session.session_id)] = session
 
     def get_session(self, tenant_id: str, session_id: str) -> Session | None:
-        return self._sessions.get(self._scope_key(tenant_id, session_id))
+        return self._sessions.get((tenant_id, session_id))
+
+    def append_turn(self, turn: Turn, content_ciphertext: bytes) -> None:
+        columns = self._turns.get((turn.tenant_id, turn.session_id))
+        if columns is None:
+            columns = self._turns.setdefault((turn.tenant_id, turn.session_id), _TurnColumns())
+        columns.append(turn, content_ciphertext)
+
+    def append_turns(self, items: list[tuple[Turn, bytes]]) -> None:
+        for turn, content_ciphertext in items:
+            self.append_turn(turn, content_ciphertext)
+
+    def list_turns(self, tenant_id: str, session_id: str, limit: int | None = None) -> list[StoredTurnRecord]:
+        columns = self._turns.get((tenant_id, session_id))
+        if columns is None:
+            return []
+        start = 0 if limit is None else max(len(columns.turn_ids) - limit, 0)
+        return self._records(tenant_id, session_id, columns, start, len(columns.turn_ids))
+
+    def list_turn_window(self, tenant_id: str, session_id: str, turn_id: str, limit: int) -> list[StoredTurnRecord]:
+        columns = self._turns.get((tenant_id, session_id))
+        if columns is None:
+            return []
+        turn_ids = columns.turn_ids
+        # The requested turn is almost always among the newest, so scan back.
+        for index in range(len(turn_ids) - 1, -1, -1):
+            if turn_ids[index] == turn_id:
+                return self._records(tenant_id, session_id, columns, max(index - limit, 0), index + 1)
+        return []
 
-    def append_turn(self, turn: Turn, content_ciphertext: str) -> None:
-        scope = self._scope_key(turn.tenant_id, turn.session_id)
-        rows = self._turns.setdefault(scope, [])
-        rows.append(
+    @staticmethod
+    def _records(
+        tenant_id: str,
+        session_id: str,
+        columns: _TurnColumns,
+        start: int,
+        stop: int,
+    ) -> list[StoredTurnRecord]:
+        return [
             StoredTurnRecord(
-                turn_id=turn.turn_id,
-                tenant_id=turn.tenant_id,
-                session_id=turn.session_id,
-                speaker=turn.speaker,
-                parent_turn_id=turn.parent_turn_id,
-                created_at=turn.created_at,
+                turn_id=turn_id,
+                tenant_id=tenant_id,
+                session_id=session_id,
+                speaker=speaker,
+                parent_turn_id=parent_turn_id,
+                created_at=created_at,
                 content_ciphertext=content_ciphertext,
             )
-        )
+            for turn_id, speaker, parent_turn_id, created_at, content_ciphertext in zip(
+                columns.turn_ids[start:stop],
+                columns.speakers[start:stop],
+                columns.parent_turn_ids[start:stop],
+                columns.created_ats[start:stop],
+                columns.content_ciphertexts[start:stop],
+            )
+        ]
 
-    def list_turns(self, tenant_id: str, session_id: str) -> list[StoredTurnRecord]:
-        return list(self._turns.get(self._scope_key(tenant_id, session_id), []))
+    def list_turn_metadata(self, tenant_id: str, session_id: str) -> list[TurnMetadata]:
+        columns = self._turns.get((tenant_id, session_id))
+        if columns is None:
+            return []
+        return [
+            TurnMetadata(turn_id=turn_id, speaker=speaker, parent_turn_id=parent_turn_id)
+            for turn_id, speaker, parent_turn_id in zip(columns.turn_ids, columns.speakers, columns.parent_turn_ids)
+        ]
 
     def is_ready(self) -> tuple[bool, str]:
         return True, "memory session store ready"
 
 
 class PostgresSessionStore(SessionStore):
-    def __init__(self, dsn: str) -> None:
-        if psycopg2 is None:
+    _APPEND_TURN_STATEMENT = "opentree_append_turn"
+
+    def __init__(self, dsn: str, min_connections: int = 1, max_connections: int = 16) -> None:
+        if psycopg2 is None or ThreadedConnectionPool is None:
             raise RuntimeError("psycopg2 is required for postgres session store backend")
-        self._dsn = dsn
+        self._pool = ThreadedConnectionPool(minconn=min_connections, maxconn=max_connections, dsn=dsn)
+        # ThreadedConnectionPool raises instead of waiting when exhausted.
+        self._slots = threading.BoundedSemaphore(max_connections)
+        # Server-side prepared statements live per connection, so remember
+        # which pooled connections already have the append statement.
+        self._prepared: weakref.WeakSet[Any] = weakref.WeakSet()
         self._ensure_schema()
 
-    def _connect(self):
-        if psycopg2 is None:
-            raise RuntimeError("psycopg2 not available")
-        return psycopg2.connect(self._dsn)
+    @contextmanager
+    def _acquire(self) -> Iterator[Any]:
+        with self._slots:
+            conn = self._pool.getconn()
+            try:
+                yield conn
+                conn.commit()
+            except Exception:
+                if not conn.closed:
+                    conn.rollback()
+                raise
+            finally:
+                self._pool.putconn(conn, close=bool(conn.closed))
 
     def _ensure_schema(self) -> None:
-        with self._connect() as conn:
+        with self._acquire() as conn:
             with conn.cursor() as cur:
                 cur.execute(
                     """
@@ -136,7 +242,7 @@ class PostgresSessionStore(SessionStore):
                         speaker TEXT NOT NULL,
                         parent_turn_id TEXT NULL,
                         created_at TIMESTAMPTZ NOT NULL,
-                        content_ciphertext TEXT NOT NULL,
+                        content_ciphertext BYTEA NOT NULL,
                         PRIMARY KEY (tenant_id, session_id, turn_id),
                         CONSTRAINT fk_turn_session
                             FOREIGN KEY (tenant_id, session_id)
@@ -145,6 +251,25 @@ class PostgresSessionStore(SessionStore):
                     )
                     """
                 )
+                # Tables created before ciphertext moved to BYTEA stored it as TEXT.
+                cur.execute(
+                    """
+                    DO $$
+                    BEGIN
+                        IF EXISTS (
+                            SELECT 1 FROM information_schema.columns
+                            WHERE table_name = 'dialogue_turns'
+                              AND column_name = 'content_ciphertext'
+                              AND data_type = 'text'
+                        ) THEN
+                            ALTER TABLE dialogue_turns
+                                ALTER COLUMN content_ciphertext TYPE BYTEA
+                                USING convert_to(content_ciphertext, 'UTF8');
+                        END IF;
+                    END
+                    $$
+                    """
+                )
                 cur.execute(
                     """
                     CREATE INDEX IF NOT EXISTS idx_dialogue_turns_lookup
@@ -153,7 +278,7 @@ class PostgresSessionStore(SessionStore):
                 )
 
     def create_session(self, session: Session) -> None:
-        with self._connect() as conn:
+        with self._acquire() as conn:
             with conn.cursor() as cur:
                 cur.execute(
                     """
@@ -166,13 +291,13 @@ class PostgresSessionStore(SessionStore):
                         session.tenant_id,
                         session.session_id,
                         session.user_id,
-                        Json(session.metadata) if Json else json.dumps(session.metadata),
+                        Json(session.metadata) if Json else orjson.dumps(session.metadata).decode(),
                         session.created_at,
                     ),
                 )
 
     def get_session(self, tenant_id: str, session_id: str) -> Session | None:
-        with self._connect() as conn:
+        with self._acquire() as conn:
             with conn.cursor() as cur:
                 cur.execute(
                     """
@@ -194,68 +319,149 @@ class PostgresSessionStore(SessionStore):
                     created_at=row[4],
                 )
 
-    def append_turn(self, turn: Turn, content_ciphertext: str) -> None:
-        with self._connect() as conn:
+    def append_turn(self, turn: Turn, content_ciphertext: bytes) -> None:
+        with self._acquire() as conn:
             with conn.cursor() as cur:
+                if conn not in self._prepared:
+                    cur.execute(
+                        f"""
+                        PREPARE {self._APPEND_TURN_STATEMENT} (TEXT, TEXT, TEXT, TEXT, TEXT, TIMESTAMPTZ, BYTEA) AS
+                        INSERT INTO dialogue_turns(
+                            tenant_id, session_id, turn_id, speaker, parent_turn_id, created_at, content_ciphertext
+                        )
+                        VALUES ($1, $2, $3, $4, $5, $6, $7)
+                        ON CONFLICT (tenant_id, session_id, turn_id) DO UPDATE
+                        SET speaker = EXCLUDED.speaker,
+                            parent_turn_id = EXCLUDED.parent_turn_id,
+                            created_at = EXCLUDED.created_at,
+                            content_ciphertext = EXCLUDED.content_ciphertext
+                        """
+                    )
+                    self._prepared.add(conn)
                 cur.execute(
+                    f"EXECUTE {self._APPEND_TURN_STATEMENT} (%s, %s, %s, %s, %s, %s, %s)",
+                    (
+                        turn.tenant_id,
+                        turn.session_id,
+                        turn.turn_id,
+                        _SPEAKER_TO_VALUE[turn.speaker],
+                        turn.parent_turn_id,
+                        turn.created_at,
+                        content_ciphertext,
+                    ),
+                )
+
+    def append_turns(self, items: list[tuple[Turn, bytes]]) -> None:
+        if not items:
+            return
+        with self._acquire() as conn:
+            with conn.cursor() as cur:
+                execute_values(
+                    cur,
                     """
                     INSERT INTO dialogue_turns(
                         tenant_id, session_id, turn_id, speaker, parent_turn_id, created_at, content_ciphertext
                     )
-                    VALUES (%s, %s, %s, %s, %s, %s, %s)
+                    VALUES %s
                     ON CONFLICT (tenant_id, session_id, turn_id) DO UPDATE
                     SET speaker = EXCLUDED.speaker,
                         parent_turn_id = EXCLUDED.parent_turn_id,
                         created_at = EXCLUDED.created_at,
                         content_ciphertext = EXCLUDED.content_ciphertext
                     """,
-                    (
-                        turn.tenant_id,
-                        turn.session_id,
-                        turn.turn_id,
-                        turn.speaker.value,
-                        turn.parent_turn_id,
-                        turn.created_at,
-                        content_ciphertext,
-                    ),
+                    [
+                        (
+                            turn.tenant_id,
+                            turn.session_id,
+                            turn.turn_id,
+                            _SPEAKER_TO_VALUE[turn.speaker],
+                            turn.parent_turn_id,
+                            turn.created_at,
+                            content_ciphertext,
+                        )
+                        for turn, content_ciphertext in items
+                    ],
+                    page_size=500,
                 )
 
-    def list_turns(self, tenant_id: str, session_id: str) -> list[StoredTurnRecord]:
-        with self._connect() as conn:
+    def list_turns(self, tenant_id: str, session_id: str, limit: int | None = None) -> list[StoredTurnRecord]:
+        # Newest first so LIMIT keeps the latest window (LIMIT NULL means no
+        # limit); the index is walked backwards and rows are flipped below.
+        with self._acquire() as conn:
             with conn.cursor() as cur:
                 cur.execute(
                     """
                     SELECT turn_id, tenant_id, session_id, speaker, parent_turn_id, created_at, content_ciphertext
                     FROM dialogue_turns
                     WHERE tenant_id = %s AND session_id = %s
-                    ORDER BY created_at ASC, turn_id ASC
+                    ORDER BY created_at DESC, turn_id DESC
+                    LIMIT %s
                     """,
-                    (tenant_id, session_id),
+                    (tenant_id, session_id, limit),
                 )
                 rows = cur.fetchall()
+        return self._records(reversed(rows))
 
-        result: list[StoredTurnRecord] = []
-        for row in rows:
-            try:
-                speaker = Speaker(str(row[3]))
-            except ValueError:
-                speaker = Speaker.USER
-            result.append(
-                StoredTurnRecord(
-                    turn_id=row[0],
-                    tenant_id=row[1],
-                    session_id=row[2],
-                    speaker=speaker,
-                    parent_turn_id=row[4],
-                    created_at=row[5],
-                    content_ciphertext=row[6],
+    def list_turn_window(self, tenant_id: str, session_id: str, turn_id: str, limit: int) -> list[StoredTurnRecord]:
+        with self._acquire() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    SELECT turn_id, tenant_id, session_id, speaker, parent_turn_id, created_at, content_ciphertext
+                    FROM dialogue_turns
+                    WHERE tenant_id = %s AND session_id = %s
+                      AND (created_at, turn_id) <= (
+                          SELECT created_at, turn_id FROM dialogue_turns
+                          WHERE tenant_id = %s AND session_id = %s AND turn_id = %s
+                      )
+                    ORDER BY created_at DESC, turn_id DESC
+                    LIMIT %s
+                    """,
+                    (tenant_id, session_id, tenant_id, session_id, turn_id, limit + 1),
+                )
+                rows = cur.fetchall()
+        return self._records(reversed(rows))
+
+    @staticmethod
+    def _records(rows: Iterable[tuple[Any, ...]]) -> list[StoredTurnRecord]:
+        return [
+            StoredTurnRecord(
+                turn_id=row[0],
+                tenant_id=row[1],
+                session_id=row[2],
+                speaker=_SPEAKER_BY_VALUE.get(row[3], Speaker.USER),
+                parent_turn_id=row[4],
+                created_at=row[5],
+                content_ciphertext=bytes(row[6]),
+            )
+            for row in rows
+        ]
+
+    def list_turn_metadata(self, tenant_id: str, session_id: str) -> list[TurnMetadata]:
+        with self._acquire() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    SELECT turn_id, speaker, parent_turn_id
+                    FROM dialogue_turns
+                    WHERE tenant_id = %s AND session_id = %s
+                    ORDER BY created_at ASC, turn_id ASC
+                    """,
+                    (tenant_id, session_id),
                 )
+                rows = cur.fetchall()
+        return [
+            TurnMetadata(
+                turn_id=row[0],
+                speaker=_SPEAKER_BY_VALUE.get(row[1], Speaker.USER),
+                parent_turn_id=row[2],
             )
-        return result
+            for row in rows
+        ]
 
     def is_ready(self) -> tuple[bool, str]:
         try:
-            with self._connect() as conn:
+            with self._acquire() as conn:
                 with conn.cursor() as cur:
                     cur.execute("SELECT 1")
                     cur.fetchone()
@@ -292,19 +498,20 @@ class RedisJobStore(JobStore):
     def _key(self, job_id: str) -> str:
         return f"{self._prefix}:{job_id}"
 
+    def _write(self, job: AsyncTurnJobResponse) -> None:
+        self._redis.set(self._key(job.job_id), _JOB_ADAPTER.dump_json(job), ex=self._ttl_seconds)
+
     def create_job(self, job: AsyncTurnJobResponse) -> None:
-        payload = job.model_dump_json()
-        self._redis.set(self._key(job.job_id), payload, ex=self._ttl_seconds)
+        self._write(job)
 
     def upsert_job(self, job: AsyncTurnJobResponse) -> None:
-        payload = job.model_dump_json()
-        self._redis.set(self._key(job.job_id), payload, ex=self._ttl_seconds)
+        self._write(job)
 
     def get_job(self, job_id: str) -> AsyncTurnJobResponse | None:
         payload = self._redis.get(self._key(job_id))
         if not payload:
             return None
-        return AsyncTurnJobResponse.model_validate_json(payload)
+        return _JOB_ADAPTER.validate_json(payload)
 
     def is_ready(self) -> tuple[bool, str]:
         try:
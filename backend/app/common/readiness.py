@@ -1,14 +1,35 @@
 from __future__ import annotations
 
+import asyncio
+import atexit
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any
 
 import httpx
 
+Probe = Callable[[], tuple[bool, str]]
+
+_CLIENT: httpx.Client | None = None
+_CLIENT_LOCK = threading.Lock()
+
+
+def _client() -> httpx.Client:
+    global _CLIENT
+    client = _CLIENT
+    if client is None:
+        with _CLIENT_LOCK:
+            client = _CLIENT
+            if client is None:
+                client = _CLIENT = httpx.Client(limits=httpx.Limits(max_keepalive_connections=32))
+                atexit.register(client.close)
+    return client
+
 
 def check_http_health(url: str, timeout_seconds: float = 1.0) -> tuple[bool, str]:
     try:
-        with httpx.Client(timeout=timeout_seconds) as client:
-            response = client.get(url)
+        response = _client().get(url, timeout=timeout_seconds)
         if 200 <= response.status_code < 300:
             return True, f"{url} healthy"
         return False, f"{url} unhealthy status={response.status_code}"
@@ -16,6 +37,29 @@ def check_http_health(url: str, timeout_seconds: float = 1.0) -> tuple[bool, str
         return False, f"{url} unreachable: {exc}"
 
 
+def _run_probe(probe: Probe) -> tuple[bool, str]:
+    try:
+        return probe()
+    except Exception as exc:
+        return False, f"check raised: {exc}"
+
+
+def run_checks_parallel(probes: dict[str, Probe]) -> dict[str, tuple[bool, str]]:
+    if not probes:
+        return {}
+    results: dict[str, tuple[bool, str]] = {}
+    with ThreadPoolExecutor(max_workers=len(probes)) as pool:
+        futures = {pool.submit(_run_probe, probe): name for name, probe in probes.items()}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    return {name: results[name] for name in probes}
+
+
+async def gather_checks(probes: dict[str, Probe]) -> dict[str, tuple[bool, str]]:
+    results = await asyncio.gather(*(asyncio.to_thread(_run_probe, probe) for probe in probes.values()))
+    return dict(zip(probes, results))
+
+
 def summarize_checks(checks: dict[str, tuple[bool, str]]) -> dict[str, Any]:
     ready = all(result[0] for result in checks.values())
     details = {name: {"ok": ok, "detail": detail} for name, (ok, detail) in checks.items()}
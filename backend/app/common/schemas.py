@@ -1,9 +1,9 @@
 from __future__ import annotations
 
+import secrets
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Any
-from uuid import uuid4
 
 from pydantic import BaseModel, Field
 
@@ -13,7 +13,7 @@ def utc_now() -> datetime:
 
 
 def new_id(prefix: str) -> str:
-    return f"{prefix}_{uuid4().hex[:12]}"
+    return f"{prefix}_{secrets.token_hex(6)}"
 
 
 class Speaker(str, Enum):
@@ -68,6 +68,38 @@ class Turn(BaseModel):
     created_at: datetime = Field(default_factory=utc_now)
 
 
+# Factories for models whose every field is produced or already validated by
+# the server; they skip Pydantic validation. Data crossing an API boundary
+# must still go through the validating constructors.
+def make_session(*, user_id: str, tenant_id: str = "public", metadata: dict[str, Any] | None = None) -> Session:
+    return Session.model_construct(
+        session_id=new_id("sess"),
+        tenant_id=tenant_id,
+        user_id=user_id,
+        metadata=metadata if metadata is not None else {},
+        created_at=utc_now(),
+    )
+
+
+def make_turn(
+    *,
+    session_id: str,
+    speaker: Speaker,
+    content: str,
+    tenant_id: str = "public",
+    parent_turn_id: str | None = None,
+) -> Turn:
+    return Turn.model_construct(
+        turn_id=new_id("turn"),
+        tenant_id=tenant_id,
+        session_id=session_id,
+        speaker=speaker,
+        content=content,
+        parent_turn_id=parent_turn_id,
+        created_at=utc_now(),
+    )
+
+
 class Concept(BaseModel):
     node_id: str = Field(default_factory=lambda: new_id("node"))
     canonical_name: str
@@ -188,3 +220,11 @@ class AsyncTurnJobResponse(BaseModel):
     status: AsyncJobStatus
     result: DialogueTurnResponse | None = None
     error: str | None = None
+
+
+class TurnProcessedEvent(BaseModel):
+    tenant_id: str
+    session_id: str
+    turn_id: str
+    status: AsyncJobStatus
+    job_id: str | None = None
@@ -1,5 +1,12 @@
 from __future__ import annotations
 
+import hashlib
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from cachetools import TTLCache
 from fastapi import Header, HTTPException
 from pydantic import BaseModel
 
@@ -10,6 +17,70 @@ try:
 except Exception:  # pragma: no cover - optional dependency fallback
     jwt = None  # type: ignore[assignment]
 
+# Verified token payloads keyed by token digest, so repeat requests with the
+# same bearer token skip the signature check. Entries never outlive the
+# token's own `exp` claim and are dropped by `reload_auth_config()`.
+_JWT_CACHE: TTLCache[bytes, dict[str, Any]] = TTLCache(maxsize=10_000, ttl=30)
+_JWT_CACHE_LOCK = threading.Lock()
+
+
+@dataclass(frozen=True)
+class _AuthConfig:
+    mode: str
+    default_tenant_id: str
+    tenant_api_keys: dict[str, str]
+    jwt_key: Any
+    jwt_algorithms: list[str]
+    jwt_audience: str | None
+    jwt_issuer: str | None
+    jwt_options: dict[str, bool]
+
+
+_AUTH_CONFIG: _AuthConfig | None = None
+
+
+def _build_auth_config() -> _AuthConfig:
+    mode = settings.auth_mode.strip().lower()
+    if settings.auth_required and mode == "none":
+        mode = "api_key"
+    return _AuthConfig(
+        mode=mode,
+        default_tenant_id=settings.default_tenant_id,
+        tenant_api_keys=dict(settings.tenant_api_keys),
+        jwt_key=_prepare_jwt_key(settings.jwt_secret, settings.jwt_algorithm),
+        jwt_algorithms=[settings.jwt_algorithm],
+        jwt_audience=settings.jwt_audience,
+        jwt_issuer=settings.jwt_issuer,
+        jwt_options={"verify_aud": settings.jwt_audience is not None},
+    )
+
+
+def _prepare_jwt_key(secret: str, algorithm: str) -> Any:
+    # Parse the verification key once (PEM decoding for RS*/ES* keys, byte
+    # conversion for HS*); jwt.decode accepts the prepared key object as-is.
+    if jwt is None:
+        return secret
+    try:
+        return jwt.get_algorithm_by_name(algorithm).prepare_key(secret)
+    except Exception:
+        return secret
+
+
+def _auth_config() -> _AuthConfig:
+    global _AUTH_CONFIG
+    config = _AUTH_CONFIG
+    if config is None:
+        config = _AUTH_CONFIG = _build_auth_config()
+    return config
+
+
+def reload_auth_config() -> None:
+    # Auth settings are read once; call this after changing them at runtime.
+    global _AUTH_CONFIG
+    _AUTH_CONFIG = None
+    with _JWT_CACHE_LOCK:
+        _JWT_CACHE.clear()
+
 
 class TenantContext(BaseModel):
     tenant_id: str
@@ -22,19 +93,18 @@ def get_tenant_context(
     x_api_key: str | None = Header(default=None, alias="X-API-Key"),
     authorization: str | None = Header(default=None, alias="Authorization"),
 ) -> TenantContext:
-    requested_tenant = (x_tenant_id or settings.default_tenant_id).strip()
+    config = _auth_config()
+    requested_tenant = (x_tenant_id or config.default_tenant_id).strip()
     if not requested_tenant:
         raise HTTPException(status_code=400, detail="Tenant header cannot be empty")
 
-    mode = settings.auth_mode.strip().lower()
-    if settings.auth_required and mode == "none":
-        mode = "api_key"
+    mode = config.mode
 
     if mode == "none":
         return TenantContext(tenant_id=requested_tenant, api_key=x_api_key)
 
     if mode == "api_key":
-        expected_key = settings.tenant_api_keys.get(requested_tenant)
+        expected_key = config.tenant_api_keys.get(requested_tenant)
         if not expected_key:
             raise HTTPException(status_code=401, detail="Unknown tenant")
         if x_api_key != expected_key:
@@ -44,18 +114,11 @@ def get_tenant_context(
     if mode == "jwt":
         if jwt is None:
             raise HTTPException(status_code=500, detail="JWT auth mode requires PyJWT dependency")
-        if not authorization or not authorization.lower().startswith("bearer "):
+        if not authorization or authorization[:7].lower() != "bearer ":
             raise HTTPException(status_code=401, detail="Missing bearer token")
-        token = authorization.split(" ", 1)[1].strip()
+        token = authorization[7:].strip()
         try:
-            payload = jwt.decode(
-                token,
-                settings.jwt_secret,
-                algorithms=[settings.jwt_algorithm],
-                audience=settings.jwt_audience,
-                issuer=settings.jwt_issuer,
-                options={"verify_aud": settings.jwt_audience is not None},
-            )
+            payload = _decode_jwt(token, config)
         except Exception as exc:
             raise HTTPException(status_code=401, detail=f"Invalid token: {exc}") from exc
 
@@ -70,6 +133,28 @@ def get_tenant_context(
     raise HTTPException(status_code=500, detail=f"Unsupported auth mode: {mode}")
 
 
+def _decode_jwt(token: str, config: _AuthConfig) -> dict[str, Any]:
+    key = hashlib.sha256(token.encode()).digest()
+    with _JWT_CACHE_LOCK:
+        payload = _JWT_CACHE.get(key)
+    if payload is not None:
+        exp = payload.get("exp")
+        if exp is None or time.time() < exp:
+            return payload
+
+    payload = jwt.decode(
+        token,
+        config.jwt_key,
+        algorithms=config.jwt_algorithms,
+        audience=config.jwt_audience,
+        issuer=config.jwt_issuer,
+        options=config.jwt_options,
+    )
+    with _JWT_CACHE_LOCK:
+        _JWT_CACHE[key] = payload
+    return payload
+
+
 def ensure_tenant_access(expected_tenant_id: str, context: TenantContext) -> None:
     if expected_tenant_id != context.tenant_id:
         raise HTTPException(status_code=403, detail="Tenant mismatch")
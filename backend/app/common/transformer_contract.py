@@ -43,3 +43,11 @@ class TransformerParseResponse(BaseModel):
     relations: list[TransformerRelation] = Field(default_factory=list)
     coreferences: list[TransformerCoreference] = Field(default_factory=list)
     knowledge_gaps: list[TransformerGap] = Field(default_factory=list)
+
+
+class TransformerParseBatchRequest(BaseModel):
+    requests: list[TransformerParseRequest] = Field(default_factory=list)
+
+
+class TransformerParseBatchResponse(BaseModel):
+    responses: list[TransformerParseResponse] = Field(default_factory=list)
@@ -1,21 +1,24 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import threading
 import time
-from datetime import datetime, timezone
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from uuid import uuid4
 
 import httpx
-from fastapi import Depends, FastAPI, HTTPException
+from fastapi import Depends, FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.concurrency import run_in_threadpool
 
 from app.common.config import settings
 from app.common.crypto import build_content_cipher
 from app.common.event_bus import EventEnvelope, build_event_bus
 from app.common.observability import install_request_metrics_middleware
-from app.common.persistence import build_job_store, build_session_store
-from app.common.readiness import check_http_health, summarize_checks
+from app.common.persistence import StoredTurnRecord, build_job_store, build_session_store
+from app.common.readiness import check_http_health, run_checks_parallel, summarize_checks
 from app.common.schemas import (
     AsyncJobStatus,
     AsyncTurnAccepted,
@@ -32,20 +35,13 @@ from app.common.schemas import (
     SuggestionResponse,
     Turn,
     TurnCreateRequest,
+    TurnProcessedEvent,
+    make_session,
+    make_turn,
     new_id,
 )
 from app.common.security import TenantContext, ensure_tenant_access, get_tenant_context
 
-app = FastAPI(title="dialogue-service", version="0.3.0")
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=False,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-install_request_metrics_middleware(app)
-
 LOGGER = logging.getLogger("opentree.dialogue")
 
 TURN_INGEST_TOPIC = "turn.ingested"
@@ -58,22 +54,48 @@ SESSION_STORE = build_session_store()
 JOB_STORE = build_job_store()
 
 WORKER_STOP = threading.Event()
-WORKER_THREAD: threading.Thread | None = None
-WORKER_LOCK = threading.Lock()
+# Idle consumes block on the bus for this long; shutdown waits one block
+# interval plus a grace period for the worker to notice the stop flag.
+WORKER_BLOCK_MS = 2000
 
+HISTORY_WINDOW = 12
 
-@app.on_event("startup")
-def on_startup() -> None:
+EVENT_BUS_READY_TTL_SECONDS = 5.0
+_EVENT_BUS_READY: tuple[float, tuple[bool, str]] | None = None
+_EVENT_BUS_READY_LOCK = threading.Lock()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # One pooled client per process keeps downstream connections alive
+    # across turns instead of reconnecting on every call.
+    app.state.http = httpx.AsyncClient(
+        timeout=httpx.Timeout(2.0, connect=0.5),
+        limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100, keepalive_expiry=30.0),
+    )
+    app.state.worker_task = None
     if settings.async_pipeline_enabled:
-        _start_async_worker()
+        WORKER_STOP.clear()
+        app.state.worker_task = asyncio.create_task(
+            _consume_turn_events(app.state.http, consumer_name=f"dialogue-{uuid4().hex[:8]}")
+        )
+    try:
+        yield
+    finally:
+        if app.state.worker_task is not None:
+            await _stop_async_worker(app.state.worker_task)
+        await app.state.http.aclose()
 
 
-@app.on_event("shutdown")
-def on_shutdown() -> None:
-    if WORKER_THREAD is None:
-        return
-    WORKER_STOP.set()
-    WORKER_THREAD.join(timeout=2.0)
+app = FastAPI(title="dialogue-service", version="0.3.0", lifespan=lifespan)
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],
+    allow_credentials=False,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+install_request_metrics_middleware(app)
 
 
 @app.get("/health")
@@ -89,14 +111,16 @@ def health() -> dict[str, str]:
 
 @app.get("/ready")
 def ready() -> dict[str, object]:
-    checks = {
-        "parser_service": check_http_health(f"{settings.parser_service_url}/health"),
-        "graph_service": check_http_health(f"{settings.graph_service_url}/health"),
-        "suggestion_service": check_http_health(f"{settings.suggestion_service_url}/health"),
-        "session_store": SESSION_STORE.is_ready(),
-        "job_store": JOB_STORE.is_ready(),
-        "event_bus": _event_bus_ready(),
-    }
+    checks = run_checks_parallel(
+        {
+            "parser_service": lambda: check_http_health(f"{settings.parser_service_url}/health"),
+            "graph_service": lambda: check_http_health(f"{settings.graph_service_url}/health"),
+            "suggestion_service": lambda: check_http_health(f"{settings.suggestion_service_url}/health"),
+            "session_store": SESSION_STORE.is_ready,
+            "job_store": JOB_STORE.is_ready,
+            "event_bus": _event_bus_ready,
+        }
+    )
     return summarize_checks(checks)
 
 
@@ -107,7 +131,7 @@ def create_session(
 ) -> Session:
     if payload.tenant_id:
         ensure_tenant_access(payload.tenant_id, tenant)
-    session = Session(tenant_id=tenant.tenant_id, user_id=payload.user_id, metadata=payload.metadata)
+    session = make_session(tenant_id=tenant.tenant_id, user_id=payload.user_id, metadata=payload.metadata)
     SESSION_STORE.create_session(session)
     return session
 
@@ -122,38 +146,48 @@ def list_turns(
 
 
 @app.post("/v1/sessions/{session_id}/turns", response_model=DialogueTurnResponse)
-def add_turn(
+async def add_turn(
     session_id: str,
     payload: TurnCreateRequest,
+    request: Request,
     tenant: TenantContext = Depends(get_tenant_context),
 ) -> DialogueTurnResponse:
-    _require_session(session_id=session_id, tenant_id=tenant.tenant_id)
+    # Store and bus calls may block on network I/O, so they run in the
+    # threadpool while the downstream HTTP calls stay on the event loop.
+    await run_in_threadpool(_require_session, session_id=session_id, tenant_id=tenant.tenant_id)
 
-    history = _materialize_turns(tenant_id=tenant.tenant_id, session_id=session_id)[-12:]
-    turn = Turn(
+    history = await run_in_threadpool(
+        _materialize_turns,
+        tenant_id=tenant.tenant_id,
+        session_id=session_id,
+        limit=HISTORY_WINDOW,
+    )
+    turn = make_turn(
         tenant_id=tenant.tenant_id,
         session_id=session_id,
         speaker=payload.speaker,
         content=payload.content,
         parent_turn_id=payload.parent_turn_id,
     )
-    _store_turn(turn)
+    await run_in_threadpool(_store_turn, turn)
 
-    response = _run_pipeline(
+    response = await _run_pipeline(
+        client=request.app.state.http,
         tenant_id=tenant.tenant_id,
         session_id=session_id,
         turn=turn,
         history=history,
         api_key=tenant.api_key,
     )
-    EVENT_BUS.publish(
+    await run_in_threadpool(
+        EVENT_BUS.publish_model,
         TURN_PROCESSED_TOPIC,
-        {
-            "tenant_id": tenant.tenant_id,
-            "session_id": session_id,
-            "turn_id": turn.turn_id,
-            "status": AsyncJobStatus.COMPLETED.value,
-        },
+        TurnProcessedEvent(
+            tenant_id=tenant.tenant_id,
+            session_id=session_id,
+            turn_id=turn.turn_id,
+            status=AsyncJobStatus.COMPLETED,
+        ),
     )
     return response
 
@@ -168,8 +202,7 @@ def add_turn_async(
         raise HTTPException(status_code=409, detail="Async pipeline is disabled")
     _require_session(session_id=session_id, tenant_id=tenant.tenant_id)
 
-    history = _materialize_turns(tenant_id=tenant.tenant_id, session_id=session_id)[-12:]
-    turn = Turn(
+    turn = make_turn(
         tenant_id=tenant.tenant_id,
         session_id=session_id,
         speaker=payload.speaker,
@@ -188,14 +221,15 @@ def add_turn_async(
     )
     JOB_STORE.create_job(job)
 
+    # Only ids travel on the bus; the consumer reads the turn and its history
+    # window back from the session store when it processes the job.
     EVENT_BUS.publish(
         TURN_INGEST_TOPIC,
         {
             "job_id": job_id,
             "tenant_id": tenant.tenant_id,
             "session_id": session_id,
-            "turn": turn.model_dump(mode="json"),
-            "history": [h.model_dump(mode="json") for h in history],
+            "turn_id": turn.turn_id,
             "api_key": tenant.api_key,
         },
         key=turn.turn_id,
@@ -219,55 +253,67 @@ def get_pipeline_job(
 def context_path(
     session_id: str,
     tenant: TenantContext = Depends(get_tenant_context),
-) -> dict[str, list[dict[str, str | None]]]:
+) -> dict[str, object]:
     _require_session(session_id=session_id, tenant_id=tenant.tenant_id)
-    path = []
-    for turn in _materialize_turns(tenant_id=tenant.tenant_id, session_id=session_id):
-        path.append(
-            {
-                "turn_id": turn.turn_id,
-                "speaker": turn.speaker.value,
-                "parent_turn_id": turn.parent_turn_id,
-            }
-        )
+    # Only ids and speakers are returned, so turn content is never decrypted.
+    path = [
+        {
+            "turn_id": meta.turn_id,
+            "speaker": meta.speaker.value,
+            "parent_turn_id": meta.parent_turn_id,
+        }
+        for meta in SESSION_STORE.list_turn_metadata(tenant_id=tenant.tenant_id, session_id=session_id)
+    ]
     return {"session_id": session_id, "path": path}
 
 
 @app.get("/v1/sessions/{session_id}/graph", response_model=GraphSnapshot)
-def get_session_graph(
+async def get_session_graph(
     session_id: str,
+    request: Request,
     tenant: TenantContext = Depends(get_tenant_context),
 ) -> GraphSnapshot:
-    _require_session(session_id=session_id, tenant_id=tenant.tenant_id)
-    with httpx.Client(timeout=2.0) as client:
-        response = client.get(
-            f"{settings.graph_service_url}/v1/graph/{session_id}",
-            headers=_service_headers(tenant_id=tenant.tenant_id, api_key=tenant.api_key),
-        )
+    await run_in_threadpool(_require_session, session_id=session_id, tenant_id=tenant.tenant_id)
+    response = await request.app.state.http.get(
+        f"{settings.graph_service_url}/v1/graph/{session_id}",
+        headers=_service_headers(tenant_id=tenant.tenant_id, api_key=tenant.api_key),
+    )
     response.raise_for_status()
-    return GraphSnapshot.model_validate(response.json())
+    return GraphSnapshot.model_validate_json(response.content)
 
 
 def _store_turn(turn: Turn) -> None:
-    SESSION_STORE.append_turn(turn=turn, content_ciphertext=CIPHER.encrypt(turn.content))
-
-
-def _materialize_turns(tenant_id: str, session_id: str) -> list[Turn]:
-    rows = SESSION_STORE.list_turns(tenant_id=tenant_id, session_id=session_id)
-    out: list[Turn] = []
-    for row in rows:
-        out.append(
-            Turn(
-                turn_id=row.turn_id,
-                tenant_id=row.tenant_id,
-                session_id=row.session_id,
-                speaker=row.speaker,
-                content=CIPHER.decrypt(row.content_ciphertext),
-                parent_turn_id=row.parent_turn_id,
-                created_at=row.created_at,
-            )
-        )
-    return out
+    SESSION_STORE.append_turn(turn=turn, content_ciphertext=CIPHER.encrypt_bytes(turn.content))
+
+
+def _materialize_turns(tenant_id: str, session_id: str, limit: int | None = None) -> list[Turn]:
+    rows = SESSION_STORE.list_turns(tenant_id=tenant_id, session_id=session_id, limit=limit)
+    return [_turn_from_record(row) for row in rows]
+
+
+def _materialize_turn_window(tenant_id: str, session_id: str, turn_id: str) -> tuple[Turn, list[Turn]]:
+    rows = SESSION_STORE.list_turn_window(
+        tenant_id=tenant_id,
+        session_id=session_id,
+        turn_id=turn_id,
+        limit=HISTORY_WINDOW,
+    )
+    if not rows:
+        raise LookupError(f"turn {turn_id} not found in session {session_id}")
+    turns = [_turn_from_record(row) for row in rows]
+    return turns[-1], turns[:-1]
+
+
+def _turn_from_record(row: StoredTurnRecord) -> Turn:
+    return Turn.model_construct(
+        turn_id=row.turn_id,
+        tenant_id=row.tenant_id,
+        session_id=row.session_id,
+        speaker=row.speaker,
+        content=CIPHER.decrypt_bytes(row.content_ciphertext),
+        parent_turn_id=row.parent_turn_id,
+        created_at=row.created_at,
+    )
 
 
 def _require_session(session_id: str, tenant_id: str) -> Session:
@@ -277,26 +323,32 @@ def _require_session(session_id: str, tenant_id: str) -> Session:
     return session
 
 
-def _run_pipeline(
+async def _run_pipeline(
+    client: httpx.AsyncClient,
     tenant_id: str,
     session_id: str,
     turn: Turn,
     history: list[Turn],
     api_key: str | None,
 ) -> DialogueTurnResponse:
-    parse_result = _call_parser(
+    parse_result = await _call_parser(
+        client,
         tenant_id=tenant_id,
         session_id=session_id,
         turn=turn,
         history=history,
         api_key=api_key,
     )
-    graph_result = _call_graph(tenant_id=tenant_id, parse_result=parse_result, api_key=api_key)
-    suggestion_result = _call_suggestion(
-        tenant_id=tenant_id,
-        session_id=session_id,
-        parse_result=parse_result,
-        api_key=api_key,
+    # Graph and suggestion both depend only on the parse result.
+    graph_result, suggestion_result = await asyncio.gather(
+        _call_graph(client, tenant_id=tenant_id, parse_result=parse_result, api_key=api_key),
+        _call_suggestion(
+            client,
+            tenant_id=tenant_id,
+            session_id=session_id,
+            parse_result=parse_result,
+            api_key=api_key,
+        ),
     )
     return DialogueTurnResponse(
         turn=turn,
@@ -306,7 +358,8 @@ def _run_pipeline(
     )
 
 
-def _call_parser(
+async def _call_parser(
+    client: httpx.AsyncClient,
     tenant_id: str,
     session_id: str,
     turn: Turn,
@@ -314,34 +367,38 @@ def _call_parser(
     api_key: str | None,
 ) -> ParseTurnResponse:
     payload = ParseTurnRequest(tenant_id=tenant_id, session_id=session_id, turn=turn, history=history)
-    with httpx.Client(timeout=2.0) as client:
-        response = client.post(
-            f"{settings.parser_service_url}/v1/parse/turn",
-            json=payload.model_dump(mode="json"),
-            headers=_service_headers(tenant_id=tenant_id, api_key=api_key),
-        )
+    response = await client.post(
+        f"{settings.parser_service_url}/v1/parse/turn",
+        content=payload.model_dump_json(),
+        headers=_service_headers(tenant_id=tenant_id, api_key=api_key),
+    )
     response.raise_for_status()
-    return ParseTurnResponse.model_validate(response.json())
+    return ParseTurnResponse.model_validate_json(response.content)
 
 
-def _call_graph(tenant_id: str, parse_result: ParseTurnResponse, api_key: str | None) -> GraphUpsertResponse:
+async def _call_graph(
+    client: httpx.AsyncClient,
+    tenant_id: str,
+    parse_result: ParseTurnResponse,
+    api_key: str | None,
+) -> GraphUpsertResponse:
     request = GraphUpsertRequest(
         tenant_id=tenant_id,
         session_id=parse_result.session_id,
         concepts=parse_result.concepts,
         relations=parse_result.relations,
     )
-    with httpx.Client(timeout=2.0) as client:
-        response = client.post(
-            f"{settings.graph_service_url}/v1/graph/upsert",
-            json=request.model_dump(mode="json"),
-            headers=_service_headers(tenant_id=tenant_id, api_key=api_key),
-        )
+    response = await client.post(
+        f"{settings.graph_service_url}/v1/graph/upsert",
+        content=request.model_dump_json(),
+        headers=_service_headers(tenant_id=tenant_id, api_key=api_key),
+    )
     response.raise_for_status()
-    return GraphUpsertResponse.model_validate(response.json())
+    return GraphUpsertResponse.model_validate_json(response.content)
 
 
-def _call_suggestion(
+async def _call_suggestion(
+    client: httpx.AsyncClient,
     tenant_id: str,
     session_id: str,
     parse_result: ParseTurnResponse,
@@ -352,93 +409,128 @@ def _call_suggestion(
         session_id=session_id,
         knowledge_gaps=parse_result.knowledge_gaps,
     )
-    with httpx.Client(timeout=2.0) as client:
-        response = client.post(
-            f"{settings.suggestion_service_url}/v1/suggestions/questions",
-            json=request.model_dump(mode="json"),
-            headers=_service_headers(tenant_id=tenant_id, api_key=api_key),
-        )
+    response = await client.post(
+        f"{settings.suggestion_service_url}/v1/suggestions/questions",
+        content=request.model_dump_json(),
+        headers=_service_headers(tenant_id=tenant_id, api_key=api_key),
+    )
     response.raise_for_status()
-    return SuggestionResponse.model_validate(response.json())
+    return SuggestionResponse.model_validate_json(response.content)
 
 
 def _service_headers(tenant_id: str, api_key: str | None) -> dict[str, str]:
-    headers = {"X-Tenant-ID": tenant_id}
+    headers = {"X-Tenant-ID": tenant_id, "Content-Type": "application/json"}
     if api_key:
         headers["X-API-Key"] = api_key
     return headers
 
 
 def _event_bus_ready() -> tuple[bool, str]:
-    try:
-        EVENT_BUS.publish(
-            "health.ping",
-            {"sent_at": datetime.now(timezone.utc).isoformat()},
-            key="dialogue",
-        )
-        return True, "event bus ready"
-    except Exception as exc:
-        return False, f"event bus not ready: {exc}"
+    # Readiness is polled every few seconds; reuse a recent probe result
+    # rather than hitting the bus on every poll.
+    global _EVENT_BUS_READY
+    cached = _EVENT_BUS_READY
+    if cached is not None and time.monotonic() - cached[0] < EVENT_BUS_READY_TTL_SECONDS:
+        return cached[1]
+    # Concurrent /ready calls share one probe; the others wait for its result.
+    with _EVENT_BUS_READY_LOCK:
+        now = time.monotonic()
+        cached = _EVENT_BUS_READY
+        if cached is not None and now - cached[0] < EVENT_BUS_READY_TTL_SECONDS:
+            return cached[1]
+        try:
+            result = EVENT_BUS.is_ready()
+        except Exception as exc:
+            result = (False, f"event bus not ready: {exc}")
+        _EVENT_BUS_READY = (now, result)
+        return result
 
 
-def _start_async_worker() -> None:
-    global WORKER_THREAD
-    with WORKER_LOCK:
-        if WORKER_THREAD and WORKER_THREAD.is_alive():
-            return
-        WORKER_STOP.clear()
-        worker_name = f"dialogue-{uuid4().hex[:8]}"
-        WORKER_THREAD = threading.Thread(
-            target=_consume_turn_events,
-            kwargs={"consumer_name": worker_name},
-            daemon=True,
-        )
-        WORKER_THREAD.start()
+async def _stop_async_worker(worker: asyncio.Task[None]) -> None:
+    WORKER_STOP.set()
+    try:
+        # Let an in-flight batch finish and ack; wait_for cancels on timeout.
+        await asyncio.wait_for(worker, timeout=WORKER_BLOCK_MS / 1000.0 + 5.0)
+    except asyncio.TimeoutError:
+        LOGGER.warning("async_worker_stop_timeout")
 
 
-def _consume_turn_events(consumer_name: str) -> None:
+async def _consume_turn_events(client: httpx.AsyncClient, consumer_name: str) -> None:
     while not WORKER_STOP.is_set():
-        messages = EVENT_BUS.consume(
+        # The bus clients are synchronous, so the blocking read and ack run in
+        # the threadpool while events are handled on the loop.
+        messages = await run_in_threadpool(
+            EVENT_BUS.consume,
             topic=TURN_INGEST_TOPIC,
             consumer_group=settings.event_bus_consumer_group,
             consumer_name=consumer_name,
             count=20,
-            block_ms=500,
+            block_ms=WORKER_BLOCK_MS,
         )
         if not messages:
             continue
-        for message in messages:
-            _handle_turn_event(message)
-        EVENT_BUS.ack(topic=TURN_INGEST_TOPIC, consumer_group=settings.event_bus_consumer_group, messages=messages)
+        await _handle_turn_batch(messages, client)
+        await run_in_threadpool(
+            EVENT_BUS.ack,
+            topic=TURN_INGEST_TOPIC,
+            consumer_group=settings.event_bus_consumer_group,
+            messages=messages,
+        )
+
+
+async def _handle_turn_batch(messages: list[EventEnvelope], client: httpx.AsyncClient) -> None:
+    semaphore = asyncio.Semaphore(max(settings.async_worker_concurrency, 1))
+
+    async def handle(message: EventEnvelope) -> None:
+        async with semaphore:
+            await _handle_turn_event(message, client)
 
+    results = await asyncio.gather(*(handle(message) for message in messages), return_exceptions=True)
+    for message, result in zip(messages, results):
+        if isinstance(result, Exception):
+            LOGGER.error("async_turn_event_failed message_id=%s error=%s", message.message_id, result)
 
-def _handle_turn_event(message: EventEnvelope) -> None:
+
+async def _handle_turn_event(message: EventEnvelope, client: httpx.AsyncClient) -> None:
     payload = message.payload
     job_id = str(payload.get("job_id", ""))
-    job = JOB_STORE.get_job(job_id)
+    job = await run_in_threadpool(JOB_STORE.get_job, job_id)
     if not job:
         return
 
-    JOB_STORE.upsert_job(job.model_copy(update={"status": AsyncJobStatus.PROCESSING}))
     max_attempts = max(settings.async_retry_max_attempts, 1)
     base_delay = max(settings.async_retry_base_delay_seconds, 0.05)
     last_error = ""
 
     for attempt in range(1, max_attempts + 1):
+        # Most jobs finish on the first attempt and go straight from QUEUED
+        # to a terminal state; PROCESSING is only recorded once retrying.
+        if attempt == 2:
+            await run_in_threadpool(
+                JOB_STORE.upsert_job,
+                job.model_copy(update={"status": AsyncJobStatus.PROCESSING}),
+            )
         try:
-            turn = Turn.model_validate(payload["turn"])
-            history = [Turn.model_validate(item) for item in payload.get("history", [])]
             tenant_id = str(payload["tenant_id"])
             session_id = str(payload["session_id"])
+            turn, history = await run_in_threadpool(
+                _materialize_turn_window,
+                tenant_id=tenant_id,
+                session_id=session_id,
+                # Events queued before ids-only payloads carried the full turn.
+                turn_id=str(payload.get("turn_id") or payload["turn"]["turn_id"]),
+            )
             api_key = payload.get("api_key")
-            result = _run_pipeline(
+            result = await _run_pipeline(
+                client=client,
                 tenant_id=tenant_id,
                 session_id=session_id,
                 turn=turn,
                 history=history,
                 api_key=str(api_key) if api_key else None,
             )
-            JOB_STORE.upsert_job(
+            await run_in_threadpool(
+                JOB_STORE.upsert_job,
                 AsyncTurnJobResponse(
                     job_id=job_id,
                     tenant_id=tenant_id,
@@ -446,17 +538,18 @@ def _handle_turn_event(message: EventEnvelope) -> None:
                     turn_id=turn.turn_id,
                     status=AsyncJobStatus.COMPLETED,
                     result=result,
-                )
+                ),
             )
-            EVENT_BUS.publish(
+            await run_in_threadpool(
+                EVENT_BUS.publish_model,
                 TURN_PROCESSED_TOPIC,
-                {
-                    "job_id": job_id,
-                    "tenant_id": tenant_id,
-                    "session_id": session_id,
-                    "turn_id": turn.turn_id,
-                    "status": AsyncJobStatus.COMPLETED.value,
-                },
+                TurnProcessedEvent(
+                    job_id=job_id,
+                    tenant_id=tenant_id,
+                    session_id=session_id,
+                    turn_id=turn.turn_id,
+                    status=AsyncJobStatus.COMPLETED,
+                ),
                 key=turn.turn_id,
             )
             return
@@ -470,11 +563,12 @@ def _handle_turn_event(message: EventEnvelope) -> None:
                 last_error,
             )
             if attempt < max_attempts:
-                time.sleep(base_delay * (2 ** (attempt - 1)))
+                await asyncio.sleep(base_delay * (2 ** (attempt - 1)))
 
     failed_job = job.model_copy(update={"status": AsyncJobStatus.FAILED, "error": last_error})
-    JOB_STORE.upsert_job(failed_job)
-    EVENT_BUS.publish(
+    await run_in_threadpool(JOB_STORE.upsert_job, failed_job)
+    await run_in_threadpool(
+        EVENT_BUS.publish,
         TURN_DEAD_LETTER_TOPIC,
         {
             "job_id": failed_job.job_id,
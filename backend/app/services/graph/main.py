@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import Depends, FastAPI, HTTPException
 
 from app.common.observability import install_request_metrics_middleware
@@ -8,12 +11,21 @@ from app.common.schemas import GraphSnapshot, GraphUpsertRequest, GraphUpsertRes
 from app.common.security import TenantContext, get_tenant_context
 from app.services.graph.repository import build_graph_repository
 
-app = FastAPI(title="graph-service", version="0.2.0")
-install_request_metrics_middleware(app)
-
 GRAPH_REPOSITORY = build_graph_repository()
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    try:
+        yield
+    finally:
+        GRAPH_REPOSITORY.close()
+
+
+app = FastAPI(title="graph-service", version="0.2.0", lifespan=lifespan)
+install_request_metrics_middleware(app)
+
+
 @app.get("/health")
 def health() -> dict[str, str]:
     return {"status": "ok", "service": "graph"}
@@ -32,8 +44,9 @@ def upsert_graph(
     if payload.tenant_id and payload.tenant_id != tenant.tenant_id:
         raise HTTPException(status_code=403, detail="Tenant mismatch in graph upsert payload")
 
-    normalized = payload.model_copy(update={"tenant_id": tenant.tenant_id})
-    return GRAPH_REPOSITORY.upsert(normalized)
+    # The request object is owned by this handler, so it is normalized in place.
+    payload.tenant_id = tenant.tenant_id
+    return GRAPH_REPOSITORY.upsert(payload)
 
 
 @app.get("/v1/graph/{session_id}", response_model=GraphSnapshot)
@@ -1,19 +1,83 @@
 from __future__ import annotations
 
+import logging
+import sys
+import threading
+import time
 from collections import defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+from queue import Empty, Full, Queue
+from typing import Any
+
+from sortedcontainers import SortedSet
 
 from app.common.config import settings
 from app.common.schemas import Concept, GraphSnapshot, GraphUpsertRequest, GraphUpsertResponse, Relation, RelationType
 
 try:
     from neo4j import GraphDatabase
+    from neo4j.exceptions import ClientError as Neo4jClientError
 except Exception:  # pragma: no cover - optional dependency fallback
     GraphDatabase = None  # type: ignore[assignment]
+    Neo4jClientError = Exception  # type: ignore[assignment,misc]
 
 try:
-    from elasticsearch import Elasticsearch
+    from elasticsearch import Elasticsearch, helpers
 except Exception:  # pragma: no cover - optional dependency fallback
     Elasticsearch = None  # type: ignore[assignment]
+    helpers = None  # type: ignore[assignment]
+
+
+_UPSERT_CONCEPTS_CYPHER = """
+UNWIND $concepts AS c
+MERGE (x:Concept {tenant_id: $tenant_id, session_id: $session_id, canonical_name: c.canonical_name})
+ON CREATE SET x.node_id = c.node_id,
+              x.aliases = c.aliases,
+              x.domain = c.domain,
+              x.confidence = c.confidence,
+              x.evidence_turn_ids = c.evidence_turn_ids
+ON MATCH SET x.aliases = reduce(acc = coalesce(x.aliases, []), a IN c.aliases |
+                 CASE WHEN a IN acc THEN acc ELSE acc + a END),
+             x.evidence_turn_ids = reduce(acc = coalesce(x.evidence_turn_ids, []), t IN c.evidence_turn_ids |
+                 CASE WHEN t IN acc THEN acc ELSE acc + t END),
+             x.confidence = CASE WHEN coalesce(x.confidence, 0.0) < c.confidence THEN c.confidence ELSE x.confidence END
+RETURN c.node_id AS input_id, x.node_id AS node_id, x.node_id = c.node_id AS created
+"""
+
+_UPSERT_RELATIONS_CYPHER = """
+UNWIND $relations AS r
+MATCH (src:Concept {tenant_id: $tenant_id, session_id: $session_id, node_id: r.source_node_id})
+MATCH (dst:Concept {tenant_id: $tenant_id, session_id: $session_id, node_id: r.target_node_id})
+MERGE (src)-[e:RELATION {tenant_id: $tenant_id, session_id: $session_id, relation_type: r.relation_type}]->(dst)
+ON CREATE SET e.edge_id = r.edge_id,
+              e.confidence = r.confidence,
+              e.evidence_turn_ids = r.evidence_turn_ids
+ON MATCH SET e.confidence = CASE WHEN coalesce(e.confidence, 0.0) < r.confidence THEN r.confidence ELSE e.confidence END,
+             e.evidence_turn_ids = reduce(acc = coalesce(e.evidence_turn_ids, []), t IN r.evidence_turn_ids |
+                 CASE WHEN t IN acc THEN acc ELSE acc + t END)
+RETURN r.edge_id AS input_id, e.edge_id AS edge_id, e.edge_id = r.edge_id AS created
+"""
+
+
+@lru_cache(maxsize=4096)
+def _normalize(name: str) -> str:
+    return sys.intern(name.strip().lower())
+
+
+READY_TTL_SECONDS = 2.0
+LOGGER = logging.getLogger("opentree.graph")
+# Queued after the last action to stop the Elasticsearch writer thread.
+_ES_STOP = object()
+
+_RELTYPE_MAP = {relation_type.value: relation_type for relation_type in RelationType}
+
+_NEO4J_SCHEMA_STATEMENTS = (
+    "CREATE CONSTRAINT concept_scope_canonical IF NOT EXISTS "
+    "FOR (c:Concept) REQUIRE (c.tenant_id, c.session_id, c.canonical_name) IS UNIQUE",
+    "CREATE INDEX concept_node_id IF NOT EXISTS FOR (c:Concept) ON (c.node_id)",
+    "CREATE INDEX relation_scope IF NOT EXISTS FOR ()-[r:RELATION]-() ON (r.tenant_id, r.session_id, r.relation_type)",
+)
 
 
 class GraphRepository:
@@ -26,17 +90,60 @@ class GraphRepository:
     def is_ready(self) -> tuple[bool, str]:
         raise NotImplementedError
 
+    def close(self) -> None:
+        return None
+
+
+# Internal merge state for the memory backend; sets stay sorted so snapshots never re-sort them.
+@dataclass(slots=True)
+class _ConceptRecord:
+    node_id: str
+    canonical_name: str
+    domain: str
+    confidence: float
+    aliases: SortedSet
+    evidence_turn_ids: SortedSet
+
+    def to_concept(self) -> Concept:
+        return Concept.model_construct(
+            node_id=self.node_id,
+            canonical_name=self.canonical_name,
+            aliases=list(self.aliases),
+            domain=self.domain,
+            confidence=self.confidence,
+            evidence_turn_ids=list(self.evidence_turn_ids),
+        )
+
+
+@dataclass(slots=True)
+class _RelationRecord:
+    edge_id: str
+    source_node_id: str
+    target_node_id: str
+    relation_type: RelationType
+    confidence: float
+    evidence_turn_ids: SortedSet
+
+    def to_relation(self) -> Relation:
+        return Relation.model_construct(
+            edge_id=self.edge_id,
+            source_node_id=self.source_node_id,
+            target_node_id=self.target_node_id,
+            relation_type=self.relation_type,
+            confidence=self.confidence,
+            evidence_turn_ids=list(self.evidence_turn_ids),
+        )
+
 
 class MemoryGraphRepository(GraphRepository):
     def __init__(self) -> None:
-        self.concepts_by_scope: dict[str, dict[str, Concept]] = defaultdict(dict)
-        self.relations_by_scope: dict[str, dict[tuple[str, str, str], Relation]] = defaultdict(dict)
-
-    def _scope_key(self, tenant_id: str, session_id: str) -> str:
-        return f"{tenant_id}:{session_id}"
+        self.concepts_by_scope: dict[tuple[str, str], dict[str, _ConceptRecord]] = defaultdict(dict)
+        self.relations_by_scope: dict[tuple[str, str], dict[str, _RelationRecord]] = defaultdict(dict)
+        self._snapshot_cache: dict[tuple[str, str], GraphSnapshot] = {}
 
     def upsert(self, payload: GraphUpsertRequest) -> GraphUpsertResponse:
-        scope_key = self._scope_key(payload.tenant_id, payload.session_id)
+        scope_key = (payload.tenant_id, payload.session_id)
+        self._snapshot_cache.pop(scope_key, None)
         session_concepts = self.concepts_by_scope[scope_key]
         session_relations = self.relations_by_scope[scope_key]
 
@@ -44,17 +151,25 @@ class MemoryGraphRepository(GraphRepository):
         added_nodes = 0
         merged_nodes = 0
         for concept in payload.concepts:
-            key = concept.canonical_name.strip().lower()
+            key = _normalize(concept.canonical_name)
             existing = session_concepts.get(key)
             if existing:
                 merged_nodes += 1
-                existing.aliases = sorted(set(existing.aliases + concept.aliases))
-                existing.evidence_turn_ids = sorted(set(existing.evidence_turn_ids + concept.evidence_turn_ids))
-                existing.confidence = max(existing.confidence, concept.confidence)
+                existing.aliases.update(concept.aliases)
+                existing.evidence_turn_ids.update(concept.evidence_turn_ids)
+                if concept.confidence > existing.confidence:
+                    existing.confidence = concept.confidence
                 id_map[concept.node_id] = existing.node_id
             else:
                 added_nodes += 1
-                session_concepts[key] = concept
+                session_concepts[key] = _ConceptRecord(
+                    node_id=concept.node_id,
+                    canonical_name=concept.canonical_name,
+                    domain=concept.domain,
+                    confidence=concept.confidence,
+                    aliases=SortedSet(concept.aliases),
+                    evidence_turn_ids=SortedSet(concept.evidence_turn_ids),
+                )
                 id_map[concept.node_id] = concept.node_id
 
         added_edges = 0
@@ -65,19 +180,23 @@ class MemoryGraphRepository(GraphRepository):
             if not src_id or not dst_id:
                 continue
 
-            relation.source_node_id = src_id
-            relation.target_node_id = dst_id
-            dedup_key = (src_id, dst_id, relation.relation_type.value)
+            dedup_key = sys.intern(f"{src_id}\x00{dst_id}\x00{relation.relation_type.value}")
             existing_relation = session_relations.get(dedup_key)
             if existing_relation:
                 merged_edges += 1
-                existing_relation.confidence = max(existing_relation.confidence, relation.confidence)
-                existing_relation.evidence_turn_ids = sorted(
-                    set(existing_relation.evidence_turn_ids + relation.evidence_turn_ids)
-                )
+                existing_relation.evidence_turn_ids.update(relation.evidence_turn_ids)
+                if relation.confidence > existing_relation.confidence:
+                    existing_relation.confidence = relation.confidence
             else:
                 added_edges += 1
-                session_relations[dedup_key] = relation
+                session_relations[dedup_key] = _RelationRecord(
+                    edge_id=relation.edge_id,
+                    source_node_id=src_id,
+                    target_node_id=dst_id,
+                    relation_type=relation.relation_type,
+                    confidence=relation.confidence,
+                    evidence_turn_ids=SortedSet(relation.evidence_turn_ids),
+                )
 
         return GraphUpsertResponse(
             tenant_id=payload.tenant_id,
@@ -89,12 +208,17 @@ class MemoryGraphRepository(GraphRepository):
         )
 
     def get_snapshot(self, tenant_id: str, session_id: str) -> GraphSnapshot | None:
-        scope_key = self._scope_key(tenant_id, session_id)
+        scope_key = (tenant_id, session_id)
+        cached = self._snapshot_cache.get(scope_key)
+        if cached is not None:
+            return cached
         if scope_key not in self.concepts_by_scope:
             return None
-        concepts = list(self.concepts_by_scope[scope_key].values())
-        relations = list(self.relations_by_scope[scope_key].values())
-        return GraphSnapshot(tenant_id=tenant_id, session_id=session_id, concepts=concepts, relations=relations)
+        concepts = [record.to_concept() for record in self.concepts_by_scope[scope_key].values()]
+        relations = [record.to_relation() for record in self.relations_by_scope[scope_key].values()]
+        snapshot = GraphSnapshot(tenant_id=tenant_id, session_id=session_id, concepts=concepts, relations=relations)
+        self._snapshot_cache[scope_key] = snapshot
+        return snapshot
 
     def is_ready(self) -> tuple[bool, str]:
         return True, "memory graph repository ready"
@@ -104,20 +228,75 @@ class Neo4jElasticsearchRepository(GraphRepository):
     def __init__(self) -> None:
         if GraphDatabase is None:
             raise RuntimeError("neo4j package is required for Neo4j graph backend")
-        self.driver = GraphDatabase.driver(
+        self._lock = threading.Lock()
+        self._driver = self._new_driver()
+        self.elasticsearch = (
+            Elasticsearch(
+                settings.elasticsearch_url,
+                max_retries=3,
+                retry_on_timeout=True,
+                http_compress=True,
+            )
+            if Elasticsearch
+            else None
+        )
+        self._ensure_schema()
+        self._ensure_indexes()
+        self._last_ready: tuple[float, tuple[bool, str]] | None = None
+        # Elasticsearch mirroring happens off the request path: upserts enqueue
+        # bulk actions and a writer thread flushes them in batches.
+        self._es_queue: Queue[object] = Queue(maxsize=settings.es_queue_max_actions)
+        self._es_writer: threading.Thread | None = None
+
+    def _new_driver(self) -> Any:
+        return GraphDatabase.driver(
             settings.neo4j_uri,
             auth=(settings.neo4j_username, settings.neo4j_password),
         )
-        self.elasticsearch = Elasticsearch(settings.elasticsearch_url) if Elasticsearch else None
-        self._ensure_indexes()
+
+    @property
+    def driver(self) -> Any:
+        # The repository is a process singleton; a lifespan re-entered after close() reopens the driver.
+        driver = self._driver
+        if driver is None:
+            with self._lock:
+                if self._driver is None:
+                    self._driver = self._new_driver()
+                driver = self._driver
+        return driver
+
+    def _ensure_es_writer(self) -> None:
+        writer = self._es_writer
+        if writer is not None and writer.is_alive():
+            return
+        with self._lock:
+            if self._es_writer is None or not self._es_writer.is_alive():
+                self._es_writer = threading.Thread(target=self._es_flush_loop, name="graph-es-bulk", daemon=True)
+                self._es_writer.start()
+
+    def _ensure_schema(self) -> None:
+        # Connection and auth errors propagate so build_graph_repository can fall back to memory.
+        try:
+            self._driver.verify_connectivity()
+        except Exception:
+            self._driver.close()
+            raise
+        with self.driver.session() as session:
+            for statement in _NEO4J_SCHEMA_STATEMENTS:
+                try:
+                    session.run(statement).consume()
+                except Neo4jClientError:
+                    continue
 
     def _ensure_indexes(self) -> None:
         if not self.elasticsearch:
             return
         try:
             if not self.elasticsearch.indices.exists(index=settings.elasticsearch_index_name):
+                # The index mirrors Neo4j, so slower refresh and async translog trade freshness for write throughput.
                 self.elasticsearch.indices.create(
                     index=settings.elasticsearch_index_name,
+                    settings={"refresh_interval": "30s", "translog": {"durability": "async"}},
                     mappings={
                         "properties": {
                             "tenant_id": {"type": "keyword"},
@@ -139,141 +318,58 @@ class Neo4jElasticsearchRepository(GraphRepository):
         merged_edges = 0
         id_map: dict[str, str] = {}
 
-        with self.driver.session() as session:
-            for concept in payload.concepts:
-                existing = session.run(
-                    """
-                    MATCH (c:Concept {tenant_id: $tenant_id, session_id: $session_id, canonical_name: $canonical_name})
-                    RETURN c.node_id AS node_id, c.aliases AS aliases, c.evidence_turn_ids AS evidence_turn_ids, c.confidence AS confidence
-                    """,
-                    tenant_id=payload.tenant_id,
-                    session_id=payload.session_id,
-                    canonical_name=concept.canonical_name,
-                ).single()
-
-                if existing:
-                    merged_nodes += 1
-                    canonical_id = existing["node_id"]
-                    aliases = sorted(set((existing["aliases"] or []) + concept.aliases))
-                    evidence_turn_ids = sorted(
-                        set((existing["evidence_turn_ids"] or []) + concept.evidence_turn_ids)
-                    )
-                    confidence = max(float(existing["confidence"] or 0.0), concept.confidence)
-                    session.run(
-                        """
-                        MATCH (c:Concept {tenant_id: $tenant_id, session_id: $session_id, canonical_name: $canonical_name})
-                        SET c.aliases = $aliases,
-                            c.evidence_turn_ids = $evidence_turn_ids,
-                            c.confidence = $confidence
-                        """,
-                        tenant_id=payload.tenant_id,
-                        session_id=payload.session_id,
-                        canonical_name=concept.canonical_name,
-                        aliases=aliases,
-                        evidence_turn_ids=evidence_turn_ids,
-                        confidence=confidence,
-                    )
-                else:
+        # Concepts and relations commit together: one durable commit and no half-applied upsert.
+        with self.driver.session() as session, session.begin_transaction() as tx:
+            concept_rows = tx.run(
+                _UPSERT_CONCEPTS_CYPHER,
+                tenant_id=payload.tenant_id,
+                session_id=payload.session_id,
+                concepts=[concept.model_dump() for concept in payload.concepts],
+            )
+            for row in concept_rows:
+                id_map[row["input_id"]] = row["node_id"]
+                if row["created"]:
                     added_nodes += 1
-                    canonical_id = concept.node_id
-                    session.run(
-                        """
-                        CREATE (c:Concept {
-                            node_id: $node_id,
-                            tenant_id: $tenant_id,
-                            session_id: $session_id,
-                            canonical_name: $canonical_name,
-                            aliases: $aliases,
-                            domain: $domain,
-                            confidence: $confidence,
-                            evidence_turn_ids: $evidence_turn_ids
-                        })
-                        """,
-                        node_id=concept.node_id,
-                        tenant_id=payload.tenant_id,
-                        session_id=payload.session_id,
-                        canonical_name=concept.canonical_name,
-                        aliases=concept.aliases,
-                        domain=concept.domain,
-                        confidence=concept.confidence,
-                        evidence_turn_ids=concept.evidence_turn_ids,
-                    )
-
-                id_map[concept.node_id] = canonical_id
-                self._index_concept(payload.tenant_id, payload.session_id, concept, canonical_id)
+                else:
+                    merged_nodes += 1
+
+            actions = [
+                self._concept_action(payload.tenant_id, payload.session_id, concept, id_map[concept.node_id])
+                for concept in payload.concepts
+            ]
 
+            relations: list[Relation] = []
             for relation in payload.relations:
                 src_id = id_map.get(relation.source_node_id)
                 dst_id = id_map.get(relation.target_node_id)
                 if not src_id or not dst_id:
                     continue
+                relation.source_node_id = src_id
+                relation.target_node_id = dst_id
+                relations.append(relation)
 
-                existing = session.run(
-                    """
-                    MATCH (src:Concept {tenant_id: $tenant_id, session_id: $session_id, node_id: $src_id})
-                          -[r:RELATION {tenant_id: $tenant_id, session_id: $session_id, relation_type: $relation_type}]->
-                          (dst:Concept {tenant_id: $tenant_id, session_id: $session_id, node_id: $dst_id})
-                    RETURN r.edge_id AS edge_id, r.confidence AS confidence, r.evidence_turn_ids AS evidence_turn_ids
-                    """,
+            edge_map: dict[str, str] = {}
+            if relations:
+                relation_rows = tx.run(
+                    _UPSERT_RELATIONS_CYPHER,
                     tenant_id=payload.tenant_id,
                     session_id=payload.session_id,
-                    src_id=src_id,
-                    dst_id=dst_id,
-                    relation_type=relation.relation_type.value,
-                ).single()
-
-                if existing:
-                    merged_edges += 1
-                    edge_id = existing["edge_id"]
-                    confidence = max(float(existing["confidence"] or 0.0), relation.confidence)
-                    evidence_turn_ids = sorted(
-                        set((existing["evidence_turn_ids"] or []) + relation.evidence_turn_ids)
-                    )
-                    session.run(
-                        """
-                        MATCH (src:Concept {tenant_id: $tenant_id, session_id: $session_id, node_id: $src_id})
-                              -[r:RELATION {tenant_id: $tenant_id, session_id: $session_id, relation_type: $relation_type}]->
-                              (dst:Concept {tenant_id: $tenant_id, session_id: $session_id, node_id: $dst_id})
-                        SET r.confidence = $confidence,
-                            r.evidence_turn_ids = $evidence_turn_ids
-                        """,
-                        tenant_id=payload.tenant_id,
-                        session_id=payload.session_id,
-                        src_id=src_id,
-                        dst_id=dst_id,
-                        relation_type=relation.relation_type.value,
-                        confidence=confidence,
-                        evidence_turn_ids=evidence_turn_ids,
-                    )
-                else:
-                    added_edges += 1
-                    edge_id = relation.edge_id
-                    session.run(
-                        """
-                        MATCH (src:Concept {tenant_id: $tenant_id, session_id: $session_id, node_id: $src_id})
-                        MATCH (dst:Concept {tenant_id: $tenant_id, session_id: $session_id, node_id: $dst_id})
-                        CREATE (src)-[:RELATION {
-                            edge_id: $edge_id,
-                            tenant_id: $tenant_id,
-                            session_id: $session_id,
-                            relation_type: $relation_type,
-                            confidence: $confidence,
-                            evidence_turn_ids: $evidence_turn_ids
-                        }]->(dst)
-                        """,
-                        edge_id=edge_id,
-                        tenant_id=payload.tenant_id,
-                        session_id=payload.session_id,
-                        src_id=src_id,
-                        dst_id=dst_id,
-                        relation_type=relation.relation_type.value,
-                        confidence=relation.confidence,
-                        evidence_turn_ids=relation.evidence_turn_ids,
-                    )
+                    relations=[relation.model_dump(mode="json") for relation in relations],
+                )
+                for row in relation_rows:
+                    edge_map[row["input_id"]] = row["edge_id"]
+                    if row["created"]:
+                        added_edges += 1
+                    else:
+                        merged_edges += 1
 
-                relation.source_node_id = src_id
-                relation.target_node_id = dst_id
-                self._index_relation(payload.tenant_id, payload.session_id, relation, edge_id)
+            for relation in relations:
+                edge_id = edge_map.get(relation.edge_id)
+                if edge_id:
+                    actions.append(self._relation_action(payload.tenant_id, payload.session_id, relation, edge_id))
+
+        if self.elasticsearch and actions:
+            self._enqueue_es(actions)
 
         return GraphUpsertResponse(
             tenant_id=payload.tenant_id,
@@ -285,34 +381,22 @@ class Neo4jElasticsearchRepository(GraphRepository):
         )
 
     def get_snapshot(self, tenant_id: str, session_id: str) -> GraphSnapshot | None:
-        concepts: list[Concept] = []
-        relations: list[Relation] = []
-
+        # Rows come from our own writes, so defaults are applied in Cypher and validation is skipped.
         with self.driver.session() as session:
             concept_rows = session.run(
                 """
                 MATCH (c:Concept {tenant_id: $tenant_id, session_id: $session_id})
                 RETURN c.node_id AS node_id,
                        c.canonical_name AS canonical_name,
-                       c.aliases AS aliases,
-                       c.domain AS domain,
-                       c.confidence AS confidence,
-                       c.evidence_turn_ids AS evidence_turn_ids
+                       coalesce(c.aliases, []) AS aliases,
+                       coalesce(c.domain, 'general') AS domain,
+                       toFloat(coalesce(c.confidence, 0.5)) AS confidence,
+                       coalesce(c.evidence_turn_ids, []) AS evidence_turn_ids
                 """,
                 tenant_id=tenant_id,
                 session_id=session_id,
             )
-            for row in concept_rows:
-                concepts.append(
-                    Concept(
-                        node_id=row["node_id"],
-                        canonical_name=row["canonical_name"],
-                        aliases=row["aliases"] or [],
-                        domain=row["domain"] or "general",
-                        confidence=float(row["confidence"] or 0.5),
-                        evidence_turn_ids=row["evidence_turn_ids"] or [],
-                    )
-                )
+            concepts = [Concept.model_construct(**row.data()) for row in concept_rows]
 
             relation_rows = session.run(
                 """
@@ -323,73 +407,122 @@ class Neo4jElasticsearchRepository(GraphRepository):
                        src.node_id AS source_node_id,
                        dst.node_id AS target_node_id,
                        r.relation_type AS relation_type,
-                       r.confidence AS confidence,
-                       r.evidence_turn_ids AS evidence_turn_ids
+                       toFloat(coalesce(r.confidence, 0.5)) AS confidence,
+                       coalesce(r.evidence_turn_ids, []) AS evidence_turn_ids
                 """,
                 tenant_id=tenant_id,
                 session_id=session_id,
             )
-            for row in relation_rows:
-                relation_type_name = row["relation_type"] or RelationType.DEFINITION.value
-                try:
-                    relation_type = RelationType(relation_type_name)
-                except ValueError:
-                    relation_type = RelationType.DEFINITION
-                relations.append(
-                    Relation(
-                        edge_id=row["edge_id"],
-                        source_node_id=row["source_node_id"],
-                        target_node_id=row["target_node_id"],
-                        relation_type=relation_type,
-                        confidence=float(row["confidence"] or 0.5),
-                        evidence_turn_ids=row["evidence_turn_ids"] or [],
-                    )
+            relations = [
+                Relation.model_construct(
+                    edge_id=row["edge_id"],
+                    source_node_id=row["source_node_id"],
+                    target_node_id=row["target_node_id"],
+                    relation_type=_RELTYPE_MAP.get(row["relation_type"], RelationType.DEFINITION),
+                    confidence=row["confidence"],
+                    evidence_turn_ids=row["evidence_turn_ids"],
                 )
+                for row in relation_rows
+            ]
 
         if not concepts and not relations:
             return None
 
-        return GraphSnapshot(tenant_id=tenant_id, session_id=session_id, concepts=concepts, relations=relations)
+        return GraphSnapshot.model_construct(
+            tenant_id=tenant_id, session_id=session_id, concepts=concepts, relations=relations
+        )
 
-    def _index_concept(self, tenant_id: str, session_id: str, concept: Concept, canonical_id: str) -> None:
-        if not self.elasticsearch:
-            return
-        try:
-            self.elasticsearch.index(
-                index=settings.elasticsearch_index_name,
-                id=f"{tenant_id}:{session_id}:concept:{canonical_id}",
-                document={
-                    "tenant_id": tenant_id,
-                    "session_id": session_id,
-                    "entity_type": "concept",
-                    "entity_id": canonical_id,
-                    "text": concept.canonical_name,
-                    "evidence_turn_ids": concept.evidence_turn_ids,
-                },
-            )
-        except Exception:
-            return
+    def _concept_action(self, tenant_id: str, session_id: str, concept: Concept, canonical_id: str) -> dict[str, object]:
+        return {
+            "_op_type": "index",
+            "_index": settings.elasticsearch_index_name,
+            "_routing": f"{tenant_id}:{session_id}",
+            "_id": f"{tenant_id}:{session_id}:concept:{canonical_id}",
+            "_source": {
+                "tenant_id": tenant_id,
+                "session_id": session_id,
+                "entity_type": "concept",
+                "entity_id": canonical_id,
+                "text": concept.canonical_name,
+                "evidence_turn_ids": concept.evidence_turn_ids,
+            },
+        }
+
+    def _relation_action(self, tenant_id: str, session_id: str, relation: Relation, edge_id: str) -> dict[str, object]:
+        return {
+            "_op_type": "index",
+            "_index": settings.elasticsearch_index_name,
+            "_routing": f"{tenant_id}:{session_id}",
+            "_id": f"{tenant_id}:{session_id}:relation:{edge_id}",
+            "_source": {
+                "tenant_id": tenant_id,
+                "session_id": session_id,
+                "entity_type": "relation",
+                "entity_id": edge_id,
+                "text": f"{relation.source_node_id} {relation.relation_type.value} {relation.target_node_id}",
+                "evidence_turn_ids": relation.evidence_turn_ids,
+            },
+        }
+
+    def _enqueue_es(self, actions: list[dict[str, object]]) -> None:
+        self._ensure_es_writer()
+        for index, action in enumerate(actions):
+            try:
+                self._es_queue.put_nowait(action)
+            except Full:
+                # Elasticsearch only mirrors Neo4j; shed search documents rather than block the upsert.
+                LOGGER.warning("es_queue_full dropped=%d", len(actions) - index)
+                return
+
+    def _es_flush_loop(self) -> None:
+        limit = settings.es_bulk_chunk_size
+        stopping = False
+        while not stopping:
+            # Block until work arrives, then take whatever else is already queued, up to one chunk.
+            item = self._es_queue.get()
+            actions: list[dict[str, object]] = []
+            while True:
+                if item is _ES_STOP:
+                    stopping = True
+                    break
+                actions.append(item)  # type: ignore[arg-type]
+                if len(actions) >= limit:
+                    break
+                try:
+                    item = self._es_queue.get_nowait()
+                except Empty:
+                    break
+            self._bulk_index(actions)
 
-    def _index_relation(self, tenant_id: str, session_id: str, relation: Relation, edge_id: str) -> None:
-        if not self.elasticsearch:
+    def _bulk_index(self, actions: list[dict[str, object]]) -> None:
+        if not self.elasticsearch or not actions:
             return
         try:
-            self.elasticsearch.index(
-                index=settings.elasticsearch_index_name,
-                id=f"{tenant_id}:{session_id}:relation:{edge_id}",
-                document={
-                    "tenant_id": tenant_id,
-                    "session_id": session_id,
-                    "entity_type": "relation",
-                    "entity_id": edge_id,
-                    "text": f"{relation.source_node_id} {relation.relation_type.value} {relation.target_node_id}",
-                    "evidence_turn_ids": relation.evidence_turn_ids,
-                },
+            indexed, errors = helpers.bulk(
+                self.elasticsearch,
+                actions,
+                chunk_size=settings.es_bulk_chunk_size,
+                max_chunk_bytes=settings.es_bulk_max_bytes,
+                request_timeout=30,
+                raise_on_error=False,
             )
         except Exception:
+            LOGGER.exception("es_bulk_failed actions=%d", len(actions))
             return
+        if errors:
+            LOGGER.warning("es_bulk_partial indexed=%d errors=%d first_error=%s", indexed, len(errors), errors[0])
 
     def is_ready(self) -> tuple[bool, str]:
+        # Probes can arrive every second; reuse a recent result instead of a Neo4j and ES round-trip each time.
+        now = time.monotonic()
+        cached = self._last_ready
+        if cached is not None and now - cached[0] < READY_TTL_SECONDS:
+            return cached[1]
+        result = self._check_ready()
+        self._last_ready = (now, result)
+        return result
+
+    def _check_ready(self) -> tuple[bool, str]:
         try:
             with self.driver.session() as session:
                 session.run("RETURN 1").single()
@@ -400,7 +533,22 @@ class Neo4jElasticsearchRepository(GraphRepository):
         except Exception as exc:
             return False, f"graph repository not ready: {exc}"
 
-
+    def close(self) -> None:
+        # Flush and stop the writer, then release the driver; the next upsert reopens both.
+        with self._lock:
+            writer, self._es_writer = self._es_writer, None
+            driver, self._driver = self._driver, None
+        if writer is not None and writer.is_alive():
+            try:
+                self._es_queue.put(_ES_STOP, timeout=5.0)
+                writer.join(timeout=5.0)
+            except Full:
+                LOGGER.warning("es_writer_stop_timeout")
+        if driver is not None:
+            driver.close()
+
+
+@lru_cache(maxsize=1)
 def build_graph_repository() -> GraphRepository:
     backend = settings.graph_backend.lower()
     if backend == "neo4j":
@@ -11,6 +11,8 @@ from app.common.transformer_contract import (
     TransformerConcept,
     TransformerCoreference,
     TransformerGap,
+    TransformerParseBatchRequest,
+    TransformerParseBatchResponse,
     TransformerParseRequest,
     TransformerParseResponse,
     TransformerRelation,
@@ -20,6 +22,9 @@ app = FastAPI(title="mock-transformer-service", version="0.1.0")
 install_request_metrics_middleware(app)
 
 TOKEN_PATTERN = re.compile(r"[A-Za-z][A-Za-z0-9_\-]{3,}")
+CAUSAL_RE = re.compile(r"because|causes|leads to", re.IGNORECASE)
+IT_RE = re.compile(r"\bit\b", re.IGNORECASE)
+MAX_CONCEPTS = 8
 
 
 @app.get("/health")
@@ -35,22 +40,21 @@ def ready() -> dict[str, object]:
 @app.post("/v1/infer/parse-turn", response_model=TransformerParseResponse)
 def parse_turn(payload: TransformerParseRequest) -> TransformerParseResponse:
     text = payload.turn.content
-    tokens = TOKEN_PATTERN.findall(text)
     concepts: list[TransformerConcept] = []
     seen: set[str] = set()
-    for token in tokens[:8]:
+    for match in TOKEN_PATTERN.finditer(text):
+        token = match.group()
         key = token.lower()
         if key in seen:
             continue
         seen.add(key)
         concepts.append(TransformerConcept(canonical_name=token, confidence=0.84))
+        if len(concepts) == MAX_CONCEPTS:
+            break
 
     relations: list[TransformerRelation] = []
     if len(concepts) >= 2:
-        relation_type = RelationType.DEFINITION
-        low = text.lower()
-        if "because" in low or "causes" in low or "leads to" in low:
-            relation_type = RelationType.CAUSAL
+        relation_type = RelationType.CAUSAL if CAUSAL_RE.search(text) else RelationType.DEFINITION
         relations.append(
             TransformerRelation(
                 source=concepts[0].canonical_name,
@@ -61,8 +65,7 @@ def parse_turn(payload: TransformerParseRequest) -> TransformerParseResponse:
         )
 
     coreferences: list[TransformerCoreference] = []
-    low = text.lower()
-    if " it " in f" {low} " and payload.history:
+    if payload.history and IT_RE.search(text):
         history_text = payload.history[-1].content.split()
         antecedent = history_text[-1] if history_text else "previous concept"
         coreferences.append(TransformerCoreference(mention="it", resolved_to=antecedent, confidence=0.76))
@@ -83,3 +86,8 @@ def parse_turn(payload: TransformerParseRequest) -> TransformerParseResponse:
         coreferences=coreferences,
         knowledge_gaps=gaps,
     )
+
+
+@app.post("/v1/infer/parse-turn-batch", response_model=TransformerParseBatchResponse)
+def parse_turn_batch(payload: TransformerParseBatchRequest) -> TransformerParseBatchResponse:
+    return TransformerParseBatchResponse(responses=[parse_turn(request) for request in payload.requests])
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import math
 import re
-from collections import defaultdict
+import threading
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator
 from typing import Any
 
 import httpx
+import orjson
 
 from app.common.config import settings
 from app.common.schemas import (
@@ -17,29 +23,85 @@ from app.common.schemas import (
     Relation,
     RelationType,
 )
-from app.common.transformer_contract import TransformerParseRequest, TransformerParseResponse
+from app.common.transformer_contract import TransformerParseRequest
 
+# Scanned separately: phrase words are also emitted as tokens, and pronouns match the lowercased turn.
 TOKEN_PATTERN = re.compile(r"[A-Za-z][A-Za-z0-9_\-]{2,}")
 PHRASE_PATTERN = re.compile(r"(?:[A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)")
+PRONOUN_RE = re.compile(r"\b(this|that|it|they|these|those)\b")
+SESSION_MEMORY_WINDOW = 50
+PARSE_CACHE_SIZE = 1024
+_STOPWORDS = frozenset({"what", "when", "where", "which", "with", "that", "this", "from", "into"})
+_RELATION_TYPE_BY_VALUE = {relation_type.value: relation_type for relation_type in RelationType}
+_GAP_TYPE_BY_VALUE = {gap_type.value: gap_type for gap_type in GapType}
+
+
+def _digest(text: str) -> bytes:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+def _as_float(value: Any, default: float) -> float | None:
+    # Missing or null uses the default; anything else that is not a finite number marks the item as malformed.
+    if value is None:
+        return default
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return number if math.isfinite(number) else None
+
+
+def _as_text(value: Any, default: str) -> str:
+    if value is None:
+        return default
+    return str(value).strip() or default
+
+
+def _aliases(raw: Any) -> list[str]:
+    if not isinstance(raw, list):
+        return []
+    return [alias for value in raw if (alias := str(value).strip())]
 
 
 class ParserBackend:
     def parse_turn(self, payload: ParseTurnRequest) -> ParseTurnResponse:
         raise NotImplementedError
 
+    async def parse_turn_async(self, payload: ParseTurnRequest) -> ParseTurnResponse:
+        return self.parse_turn(payload)
+
+    def close(self) -> None:
+        return None
+
+    async def aclose(self) -> None:
+        self.close()
+
 
 class HeuristicParserBackend(ParserBackend):
-    def __init__(self) -> None:
-        self.session_concept_memory: dict[str, list[str]] = defaultdict(list)
+    def __init__(self, session_memory_max: int = 10000) -> None:
+        self.session_memory_max = max(1, session_memory_max)
+        self.session_concept_memory: OrderedDict[str, deque[str]] = OrderedDict()
 
     def _memory_key(self, tenant_id: str, session_id: str) -> str:
         return f"{tenant_id}:{session_id}"
 
-    def _extract_concepts(self, text: str, turn_id: str) -> list[Concept]:
+    def _remember(self, memory_key: str, concept_names: list[str]) -> None:
+        memory = self.session_concept_memory.get(memory_key)
+        if memory is None:
+            memory = self.session_concept_memory[memory_key] = deque(maxlen=SESSION_MEMORY_WINDOW)
+            while len(self.session_concept_memory) > self.session_memory_max:
+                self.session_concept_memory.popitem(last=False)
+        else:
+            self.session_concept_memory.move_to_end(memory_key)
+        memory.extend(concept_names)
+
+    def _extract_concepts(self, text: str, text_low: str, turn_id: str) -> list[Concept]:
         concepts: list[Concept] = []
         seen: set[str] = set()
 
-        for phrase in PHRASE_PATTERN.findall(text):
+        # Phrases need capitals; an all-lowercase turn skips the phrase scan.
+        phrases = PHRASE_PATTERN.findall(text) if text_low != text else ()
+        for phrase in phrases:
             key = phrase.lower()
             if key in seen:
                 continue
@@ -52,13 +114,14 @@ class HeuristicParserBackend(ParserBackend):
                 )
             )
 
+        seen_add = seen.add
         for token in TOKEN_PATTERN.findall(text):
-            low = token.lower()
-            if low in seen or low in {"what", "when", "where", "which", "with", "that", "this", "from", "into"}:
+            if len(token) < 5:
                 continue
-            if len(low) < 5:
+            low = token.lower()
+            if low in seen or low in _STOPWORDS:
                 continue
-            seen.add(low)
+            seen_add(low)
             concepts.append(
                 Concept(
                     canonical_name=token,
@@ -69,12 +132,13 @@ class HeuristicParserBackend(ParserBackend):
 
         return concepts
 
-    def _extract_relations(self, text: str, concepts: list[Concept], turn_id: str) -> list[Relation]:
+    def _extract_relations(self, text_low: str, concepts: list[Concept], turn_id: str) -> list[Relation]:
         if len(concepts) < 2:
             return []
 
         relation_type = None
-        text_low = text.lower()
+        # Plain substring checks measured faster than one alternation regex for these few cues.
+        # The order encodes priority, so keep it when adding cues.
         if "because" in text_low or "leads to" in text_low or "causes" in text_low:
             relation_type = RelationType.CAUSAL
         elif "before" in text_low or "after" in text_low or "then" in text_low:
@@ -101,15 +165,16 @@ class HeuristicParserBackend(ParserBackend):
             )
         ]
 
-    def _resolve_coreference(self, tenant_id: str, session_id: str, text: str) -> list[Coreference]:
+    def _resolve_coreference(self, tenant_id: str, session_id: str, mention_hits: list[str]) -> list[Coreference]:
         matches = []
-        mention_hits = re.findall(r"\b(this|that|it|they|these|those)\b", text.lower())
         if not mention_hits:
             return matches
 
-        memory = self.session_concept_memory.get(self._memory_key(tenant_id, session_id), [])
+        memory_key = self._memory_key(tenant_id, session_id)
+        memory = self.session_concept_memory.get(memory_key)
         if not memory:
             return matches
+        self.session_concept_memory.move_to_end(memory_key)
 
         antecedent = memory[-1]
         for mention in mention_hits:
@@ -119,13 +184,14 @@ class HeuristicParserBackend(ParserBackend):
     def _build_gaps(
         self,
         session_id: str,
-        text: str,
+        text_low: str,
         concepts: list[Concept],
+        mention_hits: list[str],
         coreferences: list[Coreference],
     ) -> list[KnowledgeGap]:
         gaps: list[KnowledgeGap] = []
 
-        if re.search(r"\b(this|that|it|they|these|those)\b", text.lower()) and not coreferences:
+        if mention_hits and not coreferences:
             gaps.append(
                 KnowledgeGap(
                     session_id=session_id,
@@ -135,7 +201,7 @@ class HeuristicParserBackend(ParserBackend):
                 )
             )
 
-        if "?" in text and len(concepts) <= 1:
+        if "?" in text_low and len(concepts) <= 1:
             gaps.append(
                 KnowledgeGap(
                     session_id=session_id,
@@ -145,7 +211,7 @@ class HeuristicParserBackend(ParserBackend):
                 )
             )
 
-        if len(concepts) >= 3 and "because" not in text.lower() and "why" in text.lower():
+        if len(concepts) >= 3 and "because" not in text_low and "why" in text_low:
             gaps.append(
                 KnowledgeGap(
                     session_id=session_id,
@@ -159,18 +225,19 @@ class HeuristicParserBackend(ParserBackend):
 
     def parse_turn(self, payload: ParseTurnRequest) -> ParseTurnResponse:
         turn = payload.turn
-        concepts = self._extract_concepts(turn.content, turn.turn_id)
-        relations = self._extract_relations(turn.content, concepts, turn.turn_id)
-        coreferences = self._resolve_coreference(payload.tenant_id, payload.session_id, turn.content)
-        gaps = self._build_gaps(payload.session_id, turn.content, concepts, coreferences)
+        text_low = turn.content.lower()
+        concepts = self._extract_concepts(turn.content, text_low, turn.turn_id)
+        relations = self._extract_relations(text_low, concepts, turn.turn_id)
+        mention_hits = PRONOUN_RE.findall(text_low)
+        coreferences = self._resolve_coreference(payload.tenant_id, payload.session_id, mention_hits)
+        gaps = self._build_gaps(payload.session_id, text_low, concepts, mention_hits, coreferences)
 
         concept_names = [c.canonical_name for c in concepts]
         if concept_names:
-            memory_key = self._memory_key(payload.tenant_id, payload.session_id)
-            self.session_concept_memory[memory_key].extend(concept_names)
-            self.session_concept_memory[memory_key] = self.session_concept_memory[memory_key][-50:]
+            self._remember(self._memory_key(payload.tenant_id, payload.session_id), concept_names)
 
-        return ParseTurnResponse(
+        # Every nested item was built by the validating model constructors above.
+        return ParseTurnResponse.model_construct(
             tenant_id=payload.tenant_id,
             session_id=payload.session_id,
             turn_id=turn.turn_id,
@@ -182,117 +249,318 @@ class HeuristicParserBackend(ParserBackend):
 
 
 class TransformerInferenceParserBackend(ParserBackend):
-    def __init__(self, inference_url: str, timeout_seconds: float, fallback: ParserBackend | None = None) -> None:
+    def __init__(
+        self,
+        inference_url: str,
+        timeout_seconds: float,
+        fallback: ParserBackend | None = None,
+        batch_max: int = 1,
+        batch_window_ms: float = 5.0,
+        cache_enabled: bool = False,
+    ) -> None:
         self.inference_url = inference_url
+        self.batch_url = f"{inference_url.rstrip('/')}-batch"
         self.timeout_seconds = timeout_seconds
         self.fallback = fallback or HeuristicParserBackend()
+        self.batch_max = batch_max
+        self.batch_window_seconds = batch_window_ms / 1000.0
+        # Reused across turns so calls to the inference service keep their connections alive.
+        self._limits = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+        self._client: httpx.Client | None = None
+        self._aclient: httpx.AsyncClient | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_guard: AsyncIterator[None] | None = None
+        self._batch_queue: asyncio.Queue[tuple[ParseTurnRequest, asyncio.Future[dict[str, Any]]]] | None = None
+        self._batch_task: asyncio.Task[None] | None = None
+        self._batch_requests: set[asyncio.Task[None]] = set()
+        self.cache_enabled = cache_enabled
+        self._output_cache: OrderedDict[tuple[Any, ...], dict[str, Any]] = OrderedDict()
 
     def parse_turn(self, payload: ParseTurnRequest) -> ParseTurnResponse:
         try:
+            cache_key = self._cache_key(payload)
+            extracted = self._cached_output(cache_key)
+            if extracted is not None:
+                return self._map_model_output(payload, extracted)
             extracted = self._call_model(payload)
-            return self._map_model_output(payload, extracted)
+            parsed = self._map_model_output(payload, extracted)
+            # Cached only once mapping succeeded, so output that fails to map is not replayed from the cache.
+            self._store_output(cache_key, extracted)
+            return parsed
         except Exception:
             return self.fallback.parse_turn(payload)
 
+    async def parse_turn_async(self, payload: ParseTurnRequest) -> ParseTurnResponse:
+        try:
+            aclient = await self._bind_loop()
+            cache_key = self._cache_key(payload)
+            extracted = self._cached_output(cache_key)
+            if extracted is not None:
+                return self._map_model_output(payload, extracted)
+            if self.batch_max > 1:
+                extracted = await self._submit_to_batch(payload)
+            else:
+                response = await aclient.post(self.inference_url, json=self._request_body(payload))
+                extracted = self._read_response(response)
+            parsed = self._map_model_output(payload, extracted)
+            self._store_output(cache_key, extracted)
+            return parsed
+        except Exception:
+            return await self.fallback.parse_turn_async(payload)
+
+    def _cache_key(self, payload: ParseTurnRequest) -> tuple[Any, ...] | None:
+        if not self.cache_enabled:
+            return None
+        turn = payload.turn
+        # Only the latest history turn can be a coreference antecedent, and only when the turn has a pronoun;
+        # contents are kept as fixed-size digests. Ids are minted per turn on mapping.
+        antecedent = None
+        if payload.history and PRONOUN_RE.search(turn.content.lower()):
+            antecedent = _digest(payload.history[-1].content)
+        return payload.tenant_id, turn.speaker, _digest(turn.content), antecedent
+
+    def _cached_output(self, cache_key: tuple[Any, ...] | None) -> dict[str, Any] | None:
+        if cache_key is None:
+            return None
+        extracted = self._output_cache.get(cache_key)
+        if extracted is not None:
+            self._output_cache.move_to_end(cache_key)
+        return extracted
+
+    def _store_output(self, cache_key: tuple[Any, ...] | None, extracted: dict[str, Any]) -> None:
+        if cache_key is None:
+            return
+        self._output_cache[cache_key] = extracted
+        self._output_cache.move_to_end(cache_key)
+        while len(self._output_cache) > PARSE_CACHE_SIZE:
+            self._output_cache.popitem(last=False)
+
+    async def _bind_loop(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if self._aclient is None or self._loop is not loop:
+            # The client pool, batch queue and collector belong to the loop that created them;
+            # another loop (a re-entered lifespan or a second app) starts with its own.
+            self._release_previous_loop()
+            self._loop = loop
+            self._aclient = self._new_async_client()
+            self._batch_queue = None
+            self._batch_task = None
+            self._batch_requests = set()
+            # asyncio.run() closes a loop's async generators before closing the loop, so this guard
+            # closes the client on its own loop even when aclose() is never awaited there.
+            self._loop_guard = self._close_with_loop(self._aclient)
+            await self._loop_guard.__anext__()
+        return self._aclient
+
+    async def _close_with_loop(self, client: httpx.AsyncClient) -> AsyncIterator[None]:
+        try:
+            yield
+        finally:
+            await client.aclose()
+
+    def _loop_tasks(self) -> list[asyncio.Task[None]]:
+        tasks = list(self._batch_requests)
+        if self._batch_task is not None:
+            tasks.append(self._batch_task)
+        return tasks
+
+    async def _close_loop_state(self, guard: AsyncIterator[None], tasks: list[asyncio.Task[None]]) -> None:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await guard.aclose()  # type: ignore[attr-defined]
+
+    def _release_previous_loop(self) -> None:
+        loop, guard = self._loop, self._loop_guard
+        # A loop closed by asyncio.run() has already run the guard.
+        if loop is None or guard is None or loop.is_closed():
+            return
+        closing = self._close_loop_state(guard, self._loop_tasks())
+        if loop.is_running():
+            asyncio.run_coroutine_threadsafe(closing, loop)
+        else:
+            # The old loop is idle and this thread is running the new one, so a helper thread drives it.
+            threading.Thread(target=loop.run_until_complete, args=(closing,), daemon=True).start()
+
+    def _new_async_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(timeout=self.timeout_seconds, limits=self._limits)
+
+    async def _submit_to_batch(self, payload: ParseTurnRequest) -> dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        if self._batch_queue is None:
+            self._batch_queue = asyncio.Queue()
+            self._batch_task = loop.create_task(self._collect_batches(self._batch_queue))
+        future: asyncio.Future[dict[str, Any]] = loop.create_future()
+        await self._batch_queue.put((payload, future))
+        return await future
+
+    async def _collect_batches(
+        self,
+        queue: asyncio.Queue[tuple[ParseTurnRequest, asyncio.Future[dict[str, Any]]]],
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.batch_window_seconds
+            while len(batch) < self.batch_max:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            # Send in the background so the next batch can fill while this one is in flight.
+            task = asyncio.create_task(self._send_batch(batch))
+            self._batch_requests.add(task)
+            task.add_done_callback(self._batch_requests.discard)
+
+    async def _send_batch(self, batch: list[tuple[ParseTurnRequest, asyncio.Future[dict[str, Any]]]]) -> None:
+        try:
+            response = await (await self._bind_loop()).post(
+                self.batch_url,
+                json={"requests": [self._request_body(payload) for payload, _ in batch]},
+            )
+            results = self._read_response(response).get("responses")
+            if not isinstance(results, list) or len(results) != len(batch):
+                raise ValueError("batch inference returned a mismatched number of responses")
+        except Exception as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, dict):
+                future.set_result(result)
+            else:
+                future.set_exception(ValueError("batch inference item must be a JSON object"))
+
     def _call_model(self, payload: ParseTurnRequest) -> dict[str, Any]:
-        request_body = TransformerParseRequest(
+        # The service only parses through parse_turn_async; this pool is built on first use by sync
+        # callers (scripts, tests) so the sync ParserBackend interface keeps working.
+        if self._client is None:
+            self._client = httpx.Client(timeout=self.timeout_seconds, limits=self._limits)
+        response = self._client.post(self.inference_url, json=self._request_body(payload))
+        return self._read_response(response)
+
+    def _request_body(self, payload: ParseTurnRequest) -> dict[str, Any]:
+        return TransformerParseRequest(
             tenant_id=payload.tenant_id,
             session_id=payload.session_id,
             turn=payload.turn,
             history=payload.history,
         ).model_dump(mode="json")
-        with httpx.Client(timeout=self.timeout_seconds) as client:
-            response = client.post(self.inference_url, json=request_body)
+
+    def _read_response(self, response: httpx.Response) -> dict[str, Any]:
         response.raise_for_status()
-        parsed = TransformerParseResponse.model_validate(response.json())
-        return parsed.model_dump(mode="json")
+        # _map_model_output checks every item itself, so the body is decoded once and not re-validated here.
+        extracted = orjson.loads(response.content)
+        if not isinstance(extracted, dict):
+            raise ValueError("inference response must be a JSON object")
+        return extracted
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    async def aclose(self) -> None:
+        if self._loop is not asyncio.get_running_loop():
+            self._release_previous_loop()
+        elif self._loop_guard is not None:
+            await self._close_loop_state(self._loop_guard, self._loop_tasks())
+        self._loop = None
+        self._loop_guard = None
+        self._aclient = None
+        self._batch_queue = None
+        self._batch_task = None
+        self._batch_requests = set()
+        self.close()
 
     def _map_model_output(self, payload: ParseTurnRequest, extracted: dict[str, Any]) -> ParseTurnResponse:
         turn_id = payload.turn.turn_id
-        concept_objects: list[Concept] = []
-        concept_id_by_name: dict[str, str] = {}
-
-        for item in extracted.get("concepts", []):
-            if not isinstance(item, dict):
-                continue
-            canonical_name = str(item.get("canonical_name", "")).strip()
-            if not canonical_name:
-                continue
-            concept = Concept(
+        concept_objects = [
+            Concept(
                 canonical_name=canonical_name,
-                aliases=[str(v) for v in item.get("aliases", []) if str(v).strip()],
-                domain=str(item.get("domain", "general")),
-                confidence=float(item.get("confidence", 0.8)),
+                aliases=_aliases(item.get("aliases")),
+                domain=_as_text(item.get("domain"), "general"),
+                confidence=confidence,
                 evidence_turn_ids=[turn_id],
             )
-            concept_objects.append(concept)
-            concept_id_by_name[canonical_name.lower()] = concept.node_id
+            for item in extracted.get("concepts") or []
+            if isinstance(item, dict)
+            and (canonical_name := _as_text(item.get("canonical_name"), ""))
+            and (confidence := _as_float(item.get("confidence"), 0.8)) is not None
+        ]
+        # Fallback safety for under-specified model output; nothing else is mapped without concepts.
+        if not concept_objects:
+            return self.fallback.parse_turn(payload)
+
+        concept_id_by_name = {concept.canonical_name.lower(): concept.node_id for concept in concept_objects}
 
         relation_objects: list[Relation] = []
-        for item in extracted.get("relations", []):
+        for item in extracted.get("relations") or []:
             if not isinstance(item, dict):
                 continue
-            source_name = str(item.get("source", "")).strip().lower()
-            target_name = str(item.get("target", "")).strip().lower()
+            source_name = _as_text(item.get("source"), "").lower()
+            target_name = _as_text(item.get("target"), "").lower()
             source_node_id = concept_id_by_name.get(source_name)
             target_node_id = concept_id_by_name.get(target_name)
-            if not source_node_id or not target_node_id:
+            confidence = _as_float(item.get("confidence"), 0.75)
+            if not source_node_id or not target_node_id or confidence is None:
                 continue
 
-            relation_type_name = str(item.get("relation_type", RelationType.DEFINITION.value))
-            try:
-                relation_type = RelationType(relation_type_name)
-            except ValueError:
-                relation_type = RelationType.DEFINITION
+            relation_type = _RELATION_TYPE_BY_VALUE.get(
+                str(item.get("relation_type", RelationType.DEFINITION.value)), RelationType.DEFINITION
+            )
 
             relation_objects.append(
                 Relation(
                     source_node_id=source_node_id,
                     target_node_id=target_node_id,
                     relation_type=relation_type,
-                    confidence=float(item.get("confidence", 0.75)),
+                    confidence=confidence,
                     evidence_turn_ids=[turn_id],
                 )
             )
 
         coreferences: list[Coreference] = []
-        for item in extracted.get("coreferences", []):
+        for item in extracted.get("coreferences") or []:
             if not isinstance(item, dict):
                 continue
-            mention = str(item.get("mention", "")).strip()
-            resolved_to = str(item.get("resolved_to", "")).strip()
-            if not mention or not resolved_to:
+            mention = _as_text(item.get("mention"), "")
+            resolved_to = _as_text(item.get("resolved_to"), "")
+            confidence = _as_float(item.get("confidence"), 0.75)
+            if not mention or not resolved_to or confidence is None:
                 continue
             coreferences.append(
                 Coreference(
                     mention=mention,
                     resolved_to=resolved_to,
-                    confidence=float(item.get("confidence", 0.75)),
+                    confidence=confidence,
                 )
             )
 
         gaps: list[KnowledgeGap] = []
-        for item in extracted.get("knowledge_gaps", []):
+        for item in extracted.get("knowledge_gaps") or []:
             if not isinstance(item, dict):
                 continue
-            try:
-                gap_type = GapType(str(item.get("gap_type")))
-            except ValueError:
+            gap_type = _GAP_TYPE_BY_VALUE.get(str(item.get("gap_type")))
+            priority = _as_float(item.get("priority"), 2)
+            if gap_type is None or priority is None:
                 continue
             gaps.append(
                 KnowledgeGap(
                     session_id=payload.session_id,
                     gap_type=gap_type,
-                    priority=int(item.get("priority", 2)),
-                    description=str(item.get("description", "Model-signaled knowledge gap.")),
+                    priority=int(priority),
+                    description=_as_text(item.get("description"), "Model-signaled knowledge gap."),
                 )
             )
 
-        # Fallback safety for under-specified model output.
-        if not concept_objects:
-            return self.fallback.parse_turn(payload)
-
-        return ParseTurnResponse(
+        return ParseTurnResponse.model_construct(
             tenant_id=payload.tenant_id,
             session_id=payload.session_id,
             turn_id=turn_id,
@@ -305,11 +573,14 @@ class TransformerInferenceParserBackend(ParserBackend):
 
 def build_parser_backend() -> ParserBackend:
     backend_name = settings.parser_backend.lower()
-    heuristic = HeuristicParserBackend()
+    heuristic = HeuristicParserBackend(session_memory_max=settings.parser_session_memory_max)
     if backend_name == "transformer" and settings.transformer_inference_url:
         return TransformerInferenceParserBackend(
             inference_url=settings.transformer_inference_url,
             timeout_seconds=settings.transformer_timeout_seconds,
             fallback=heuristic,
+            batch_max=settings.parser_batch_max,
+            batch_window_ms=settings.parser_batch_window_ms,
+            cache_enabled=settings.parser_cache_enabled,
         )
     return heuristic
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from urllib.parse import urlsplit, urlunsplit
 
 from fastapi import Depends, FastAPI, HTTPException
@@ -11,12 +13,21 @@ from app.common.schemas import ParseTurnRequest, ParseTurnResponse
 from app.common.security import TenantContext, get_tenant_context
 from app.services.parser.backends import build_parser_backend
 
-app = FastAPI(title="parser-service", version="0.2.0")
-install_request_metrics_middleware(app)
-
 PARSER_BACKEND = build_parser_backend()
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    try:
+        yield
+    finally:
+        await PARSER_BACKEND.aclose()
+
+
+app = FastAPI(title="parser-service", version="0.2.0", lifespan=lifespan)
+install_request_metrics_middleware(app)
+
+
 @app.get("/health")
 def health() -> dict[str, str]:
     return {"status": "ok", "service": "parser", "backend": settings.parser_backend}
@@ -36,14 +47,15 @@ def ready() -> dict[str, object]:
 
 
 @app.post("/v1/parse/turn", response_model=ParseTurnResponse)
-def parse_turn(
+async def parse_turn(
     payload: ParseTurnRequest,
     tenant: TenantContext = Depends(get_tenant_context),
 ) -> ParseTurnResponse:
     if payload.tenant_id and payload.tenant_id != tenant.tenant_id:
         raise HTTPException(status_code=403, detail="Tenant mismatch in parse payload")
-    normalized = payload.model_copy(update={"tenant_id": tenant.tenant_id})
-    return PARSER_BACKEND.parse_turn(normalized)
+    # The request object is owned by this handler, so it is normalized in place.
+    payload.tenant_id = tenant.tenant_id
+    return await PARSER_BACKEND.parse_turn_async(payload)
 
 
 def _transformer_health_url() -> str:
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from operator import attrgetter
+
 from fastapi import Depends, FastAPI, HTTPException
 
 from app.common.observability import install_request_metrics_middleware
@@ -7,6 +9,13 @@ from app.common.readiness import summarize_checks
 from app.common.schemas import GapType, Suggestion, SuggestionRequest, SuggestionResponse
 from app.common.security import TenantContext, get_tenant_context
 
+_QUESTION_BY_GAP = {
+    GapType.AMBIGUOUS_REFERENCE: "Can you clarify exactly which concept your pronoun refers to?",
+    GapType.MISSING_PREREQUISITE: "What prerequisite concept should we define first before this topic?",
+    GapType.WEAK_EVIDENCE: "What evidence or source best supports this relationship?",
+}
+_DEFAULT_QUESTION = "Which branch should we expand next to make this knowledge path complete?"
+
 app = FastAPI(title="suggestion-service", version="0.1.0")
 install_request_metrics_middleware(app)
 
@@ -22,25 +31,7 @@ def ready() -> dict[str, object]:
 
 
 def _gap_to_question(gap_type: GapType, description: str) -> tuple[str, str]:
-    if gap_type == GapType.AMBIGUOUS_REFERENCE:
-        return (
-            "Can you clarify exactly which concept your pronoun refers to?",
-            description,
-        )
-    if gap_type == GapType.MISSING_PREREQUISITE:
-        return (
-            "What prerequisite concept should we define first before this topic?",
-            description,
-        )
-    if gap_type == GapType.WEAK_EVIDENCE:
-        return (
-            "What evidence or source best supports this relationship?",
-            description,
-        )
-    return (
-        "Which branch should we expand next to make this knowledge path complete?",
-        description,
-    )
+    return _QUESTION_BY_GAP.get(gap_type, _DEFAULT_QUESTION), description
 
 
 @app.post("/v1/suggestions/questions", response_model=SuggestionResponse)
@@ -52,7 +43,7 @@ def suggest_questions(
         raise HTTPException(status_code=403, detail="Tenant mismatch in suggestion payload")
 
     ranked: list[Suggestion] = []
-    for gap in sorted(payload.knowledge_gaps, key=lambda g: g.priority, reverse=True):
+    for gap in sorted(payload.knowledge_gaps, key=attrgetter("priority"), reverse=True):
         q, reason = _gap_to_question(gap.gap_type, gap.description)
         ranked.append(Suggestion(question=q, reason=reason, priority=gap.priority))
 
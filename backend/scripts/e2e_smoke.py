@@ -1,39 +1,51 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-import json
 import os
 import time
-import urllib.error
-import urllib.request
 
+import httpx
+import orjson
 
-def _request(method: str, url: str, payload: dict | None = None) -> dict:
-    body = None
-    headers = {"Content-Type": "application/json", "X-Tenant-ID": os.getenv("TENANT_ID", "public")}
-    if payload is not None:
-        body = json.dumps(payload).encode("utf-8")
-    req = urllib.request.Request(url=url, data=body, headers=headers, method=method)
-    try:
-        with urllib.request.urlopen(req, timeout=5) as res:  # noqa: S310 - local dev URLs only
-            raw = res.read().decode("utf-8")
-            return json.loads(raw) if raw else {}
-    except urllib.error.HTTPError as exc:
-        raise RuntimeError(f"{method} {url} failed status={exc.code} body={exc.read().decode('utf-8')}") from exc
+HEADERS = {"Content-Type": "application/json", "X-Tenant-ID": os.getenv("TENANT_ID", "public")}
+JOB_POLL_TIMEOUT_SECONDS = 5.0
+JOB_POLL_INITIAL_DELAY_SECONDS = 0.05
+JOB_POLL_MAX_DELAY_SECONDS = 1.0
 
 
-def main() -> None:
-    dialogue_url = os.getenv("DIALOGUE_URL", "http://127.0.0.1:8101")
-    ready = _request("GET", f"{dialogue_url}/ready")
+def _request(client: httpx.Client, method: str, url: str, payload: dict | None = None) -> dict:
+    res = client.request(method, url, content=None if payload is None else orjson.dumps(payload))
+    if res.is_error:
+        raise RuntimeError(f"{method} {url} failed status={res.status_code} body={res.text}")
+    return orjson.loads(res.content) if res.content else {}
+
+
+def _wait_for_job(client: httpx.Client, job_id: str) -> dict:
+    deadline = time.monotonic() + JOB_POLL_TIMEOUT_SECONDS
+    delay = JOB_POLL_INITIAL_DELAY_SECONDS
+    while True:
+        job = _request(client, "GET", f"/v1/pipeline/jobs/{job_id}")
+        if job.get("status") in {"completed", "failed"}:
+            return job
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return job
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, JOB_POLL_MAX_DELAY_SECONDS)
+
+
+def _run(client: httpx.Client) -> None:
+    ready = _request(client, "GET", "/ready")
     if not ready.get("ready"):
         raise RuntimeError(f"dialogue service not ready: {ready}")
 
-    session = _request("POST", f"{dialogue_url}/v1/sessions", {"user_id": "smoke"})
+    session = _request(client, "POST", "/v1/sessions", {"user_id": "smoke"})
     session_id = session["session_id"]
 
     sync_result = _request(
+        client,
         "POST",
-        f"{dialogue_url}/v1/sessions/{session_id}/turns",
+        f"/v1/sessions/{session_id}/turns",
         {
             "speaker": "user",
             "content": "Transformer models improve retrieval because they encode context.",
@@ -43,8 +55,9 @@ def main() -> None:
         raise RuntimeError(f"unexpected sync response: {sync_result}")
 
     accepted = _request(
+        client,
         "POST",
-        f"{dialogue_url}/v1/sessions/{session_id}/turns/async",
+        f"/v1/sessions/{session_id}/turns/async",
         {
             "speaker": "user",
             "content": "It also helps disambiguate references.",
@@ -52,22 +65,22 @@ def main() -> None:
     )
     job_id = accepted["job_id"]
 
-    job = {}
-    for _ in range(25):
-        job = _request("GET", f"{dialogue_url}/v1/pipeline/jobs/{job_id}")
-        if job.get("status") in {"completed", "failed"}:
-            break
-        time.sleep(0.2)
-
+    job = _wait_for_job(client, job_id)
     if job.get("status") != "completed":
         raise RuntimeError(f"async job did not complete: {job}")
 
-    graph = _request("GET", f"{dialogue_url}/v1/sessions/{session_id}/graph")
+    graph = _request(client, "GET", f"/v1/sessions/{session_id}/graph")
     if "concepts" not in graph:
         raise RuntimeError(f"unexpected graph response: {graph}")
 
     print("Smoke test passed")
 
 
+def main() -> None:
+    dialogue_url = os.getenv("DIALOGUE_URL", "http://127.0.0.1:8101")
+    with httpx.Client(base_url=dialogue_url, headers=HEADERS, timeout=5) as client:
+        _run(client)
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from app.common import config
+from app.common.config import Settings
+
+
+def test_reload_resnapshots_environment(monkeypatch) -> None:
+    monkeypatch.setenv("GRAPH_BACKEND", "neo4j")
+    monkeypatch.setenv("ASYNC_PIPELINE_ENABLED", "yes")
+    try:
+        Settings.reload()
+        assert config.settings.graph_backend == "neo4j"
+        assert config.settings.async_pipeline_enabled is True
+    finally:
+        monkeypatch.undo()
+        Settings.reload()
+
+
+def test_reload_keeps_the_module_singleton() -> None:
+    before = config.settings
+    Settings.reload()
+    assert config.settings is before
+
+
+def test_fields_resolve_on_first_access(monkeypatch) -> None:
+    monkeypatch.setenv("TENANT_API_KEYS_JSON", '{"k1": "tenant_a"}')
+    monkeypatch.setenv("TRANSFORMER_TIMEOUT_SECONDS", "2.5")
+    try:
+        Settings.reload()
+        fresh = Settings()
+        assert "tenant_api_keys" not in vars(fresh)
+        assert fresh.tenant_api_keys == {"k1": "tenant_a"}
+        assert fresh.transformer_timeout_seconds == 2.5
+        assert "tenant_api_keys" in vars(fresh)
+    finally:
+        monkeypatch.undo()
+        Settings.reload()
@@ -1,7 +1,13 @@
 from __future__ import annotations
 
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+
 from app.common.event_bus import EventEnvelope, InMemoryEventBus
-from app.common.persistence import MemoryJobStore
+from app.common.persistence import MemoryJobStore, MemorySessionStore
 from app.common.schemas import (
     AsyncJobStatus,
     AsyncTurnJobResponse,
@@ -28,6 +34,14 @@ def _build_dialogue_result(turn: Turn) -> DialogueTurnResponse:
     return DialogueTurnResponse(turn=turn, parse=parse, graph_update=graph, suggested_questions=suggestion.suggestions)
 
 
+def _handle(message: EventEnvelope) -> None:
+    async def run() -> None:
+        async with httpx.AsyncClient() as client:
+            await dialogue_main._handle_turn_event(message, client)
+
+    asyncio.run(run())
+
+
 def test_async_retry_then_success(monkeypatch) -> None:
     original_job_store = dialogue_main.JOB_STORE
     original_event_bus = dialogue_main.EVENT_BUS
@@ -38,8 +52,13 @@ def test_async_retry_then_success(monkeypatch) -> None:
         dialogue_main.EVENT_BUS = InMemoryEventBus()
         dialogue_main.settings.async_retry_max_attempts = 3
         dialogue_main.settings.async_retry_base_delay_seconds = 0.0
+        monkeypatch.setattr(dialogue_main, "SESSION_STORE", MemorySessionStore())
 
+        earlier = Turn(tenant_id="public", session_id="sess_demo", speaker="user", content="earlier")
         turn = Turn(tenant_id="public", session_id="sess_demo", speaker="user", content="hello")
+        later = Turn(tenant_id="public", session_id="sess_demo", speaker="user", content="later")
+        for stored in (earlier, turn, later):
+            dialogue_main._store_turn(stored)
         job = AsyncTurnJobResponse(
             job_id="job_demo",
             tenant_id="public",
@@ -49,10 +68,12 @@ def test_async_retry_then_success(monkeypatch) -> None:
         )
         dialogue_main.JOB_STORE.create_job(job)
 
-        state = {"attempts": 0}
+        state = {"attempts": 0, "statuses": [], "seen": []}
 
-        def fake_run_pipeline(**kwargs):  # type: ignore[no-untyped-def]
+        async def fake_run_pipeline(**kwargs):  # type: ignore[no-untyped-def]
             state["attempts"] += 1
+            state["seen"].append((kwargs["turn"].content, [h.content for h in kwargs["history"]]))
+            state["statuses"].append(dialogue_main.JOB_STORE.get_job("job_demo").status)
             if state["attempts"] == 1:
                 raise RuntimeError("transient")
             return _build_dialogue_result(kwargs["turn"])
@@ -66,17 +87,18 @@ def test_async_retry_then_success(monkeypatch) -> None:
                 "job_id": "job_demo",
                 "tenant_id": "public",
                 "session_id": "sess_demo",
-                "turn": turn.model_dump(mode="json"),
-                "history": [],
+                "turn_id": turn.turn_id,
                 "api_key": None,
             },
         )
-        dialogue_main._handle_turn_event(message)
+        _handle(message)
 
         result = dialogue_main.JOB_STORE.get_job("job_demo")
         assert result is not None
         assert result.status == AsyncJobStatus.COMPLETED
         assert state["attempts"] == 2
+        assert state["statuses"] == [AsyncJobStatus.QUEUED, AsyncJobStatus.PROCESSING]
+        assert state["seen"] == [("hello", ["earlier"])] * 2
     finally:
         dialogue_main.JOB_STORE = original_job_store
         dialogue_main.EVENT_BUS = original_event_bus
@@ -95,8 +117,10 @@ def test_async_dead_letter_after_max_retries(monkeypatch) -> None:
         dialogue_main.EVENT_BUS = bus
         dialogue_main.settings.async_retry_max_attempts = 2
         dialogue_main.settings.async_retry_base_delay_seconds = 0.0
+        monkeypatch.setattr(dialogue_main, "SESSION_STORE", MemorySessionStore())
 
         turn = Turn(tenant_id="public", session_id="sess_demo", speaker="user", content="hello")
+        dialogue_main._store_turn(turn)
         job = AsyncTurnJobResponse(
             job_id="job_fail",
             tenant_id="public",
@@ -106,7 +130,7 @@ def test_async_dead_letter_after_max_retries(monkeypatch) -> None:
         )
         dialogue_main.JOB_STORE.create_job(job)
 
-        def always_fail(**kwargs):  # type: ignore[no-untyped-def]
+        async def always_fail(**kwargs):  # type: ignore[no-untyped-def]
             del kwargs
             raise RuntimeError("persistent-failure")
 
@@ -119,12 +143,11 @@ def test_async_dead_letter_after_max_retries(monkeypatch) -> None:
                 "job_id": "job_fail",
                 "tenant_id": "public",
                 "session_id": "sess_demo",
-                "turn": turn.model_dump(mode="json"),
-                "history": [],
+                "turn_id": turn.turn_id,
                 "api_key": None,
             },
         )
-        dialogue_main._handle_turn_event(message)
+        _handle(message)
 
         result = dialogue_main.JOB_STORE.get_job("job_fail")
         assert result is not None
@@ -137,3 +160,115 @@ def test_async_dead_letter_after_max_retries(monkeypatch) -> None:
         dialogue_main.EVENT_BUS = original_event_bus
         dialogue_main.settings.async_retry_max_attempts = original_attempts
         dialogue_main.settings.async_retry_base_delay_seconds = original_delay
+
+
+def test_pipeline_runs_graph_and_suggestion_concurrently(monkeypatch) -> None:
+    turn = Turn(tenant_id="public", session_id="sess_demo", speaker="user", content="hello")
+    expected = _build_dialogue_result(turn)
+    in_flight = {"now": 0, "peak": 0}
+
+    async def fake_parser(client, **kwargs):  # type: ignore[no-untyped-def]
+        del client, kwargs
+        return expected.parse
+
+    def downstream(result):  # type: ignore[no-untyped-def]
+        async def call(client, **kwargs):  # type: ignore[no-untyped-def]
+            del client, kwargs
+            in_flight["now"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            await asyncio.sleep(0.01)
+            in_flight["now"] -= 1
+            return result
+
+        return call
+
+    monkeypatch.setattr(dialogue_main, "_call_parser", fake_parser)
+    monkeypatch.setattr(dialogue_main, "_call_graph", downstream(expected.graph_update))
+    monkeypatch.setattr(
+        dialogue_main,
+        "_call_suggestion",
+        downstream(SuggestionResponse(tenant_id="public", session_id="sess_demo", suggestions=[])),
+    )
+
+    result = asyncio.run(
+        dialogue_main._run_pipeline(
+            client=None,
+            tenant_id="public",
+            session_id="sess_demo",
+            turn=turn,
+            history=[],
+            api_key=None,
+        )
+    )
+
+    assert result.graph_update == expected.graph_update
+    assert in_flight["peak"] == 2
+
+
+def test_turn_batch_is_handled_concurrently_up_to_the_limit(monkeypatch) -> None:
+    original_concurrency = dialogue_main.settings.async_worker_concurrency
+    in_flight = {"now": 0, "peak": 0}
+
+    async def fake_handle(message, client):  # type: ignore[no-untyped-def]
+        del client
+        in_flight["now"] += 1
+        in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        await asyncio.sleep(0.01)
+        in_flight["now"] -= 1
+        if message.message_id == "m0":
+            raise RuntimeError("boom")
+
+    try:
+        dialogue_main.settings.async_worker_concurrency = 3
+        monkeypatch.setattr(dialogue_main, "_handle_turn_event", fake_handle)
+        messages = [
+            EventEnvelope(message_id=f"m{i}", topic="turn.ingested", key=None, payload={}) for i in range(8)
+        ]
+
+        asyncio.run(dialogue_main._handle_turn_batch(messages, None))
+
+        assert in_flight["peak"] == 3
+        assert in_flight["now"] == 0
+    finally:
+        dialogue_main.settings.async_worker_concurrency = original_concurrency
+
+
+def test_event_bus_readiness_is_cached_briefly(monkeypatch) -> None:
+    calls = {"count": 0}
+
+    class _Bus(InMemoryEventBus):
+        def is_ready(self) -> tuple[bool, str]:
+            calls["count"] += 1
+            return True, "ok"
+
+    clock = {"now": 1000.0}
+    monkeypatch.setattr(dialogue_main, "EVENT_BUS", _Bus())
+    monkeypatch.setattr(dialogue_main, "_EVENT_BUS_READY", None)
+    monkeypatch.setattr(dialogue_main.time, "monotonic", lambda: clock["now"])
+
+    assert dialogue_main._event_bus_ready() == (True, "ok")
+    assert dialogue_main._event_bus_ready() == (True, "ok")
+    assert calls["count"] == 1
+
+    clock["now"] += dialogue_main.EVENT_BUS_READY_TTL_SECONDS
+    dialogue_main._event_bus_ready()
+    assert calls["count"] == 2
+
+
+def test_event_bus_readiness_probe_is_shared_by_concurrent_callers(monkeypatch) -> None:
+    calls = {"count": 0}
+
+    class _SlowBus(InMemoryEventBus):
+        def is_ready(self) -> tuple[bool, str]:
+            calls["count"] += 1
+            time.sleep(0.05)
+            return True, "ok"
+
+    monkeypatch.setattr(dialogue_main, "EVENT_BUS", _SlowBus())
+    monkeypatch.setattr(dialogue_main, "_EVENT_BUS_READY", None)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda _: dialogue_main._event_bus_ready(), range(8)))
+
+    assert results == [(True, "ok")] * 8
+    assert calls["count"] == 1
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import orjson
+import pytest
+from redis.exceptions import ResponseError
+
+from app.common.event_bus import InMemoryEventBus, RedisStreamEventBus
+from app.common.schemas import AsyncJobStatus, TurnProcessedEvent
+
+
+def test_inmemory_consume_is_fifo_and_respects_count() -> None:
+    bus = InMemoryEventBus()
+    for i in range(5):
+        bus.publish("topic.a", {"i": i})
+
+    first = bus.consume("topic.a", consumer_group="g", consumer_name="c", count=3, block_ms=0)
+    rest = bus.consume("topic.a", consumer_group="g", consumer_name="c", count=10, block_ms=0)
+
+    assert [m.payload["i"] for m in first] == [0, 1, 2]
+    assert [m.payload["i"] for m in rest] == [3, 4]
+    assert bus.consume("topic.a", consumer_group="g", consumer_name="c", block_ms=0) == []
+
+
+@pytest.mark.parametrize("shards", [1, 8])
+def test_inmemory_topics_are_isolated(shards: int) -> None:
+    bus = InMemoryEventBus(shards=shards)
+    bus.publish("topic.a", {"v": "a"})
+    bus.publish("topic.b", {"v": "b"})
+
+    messages = bus.consume("topic.b", consumer_group="g", consumer_name="c", block_ms=0)
+
+    assert [m.payload["v"] for m in messages] == ["b"]
+
+
+def test_inmemory_blocking_consume_wakes_on_publish() -> None:
+    bus = InMemoryEventBus()
+    threading.Timer(0.05, bus.publish, args=("topic.a", {"v": 1})).start()
+
+    started = time.perf_counter()
+    messages = bus.consume("topic.a", consumer_group="g", consumer_name="c", block_ms=5000)
+
+    assert [m.payload["v"] for m in messages] == [1]
+    assert time.perf_counter() - started < 2.0
+
+
+class _FakeRedis:
+    def __init__(self, create_error: Exception | None = None) -> None:
+        self.groups_created = 0
+        self.create_error = create_error
+
+    def xgroup_create(self, name, groupname, id="$", mkstream=False):  # type: ignore[no-untyped-def]
+        del name, groupname, id, mkstream
+        self.groups_created += 1
+        if self.create_error is not None:
+            raise self.create_error
+
+    def xreadgroup(self, **kwargs):  # type: ignore[no-untyped-def]
+        del kwargs
+        return []
+
+    def xadd(self, name, fields):  # type: ignore[no-untyped-def]
+        self.added = (name, fields)
+        return "1-0"
+
+
+def test_redis_consume_creates_group_once() -> None:
+    bus = RedisStreamEventBus(redis_url="redis://127.0.0.1:6379/0", stream_prefix="test")
+    fake = _FakeRedis()
+    bus._redis = fake  # type: ignore[assignment]
+
+    for _ in range(3):
+        bus.consume("topic.a", consumer_group="g", consumer_name="c", block_ms=0)
+
+    assert fake.groups_created == 1
+
+
+def test_redis_existing_group_is_tolerated_but_other_errors_raise() -> None:
+    bus = RedisStreamEventBus(redis_url="redis://127.0.0.1:6379/0", stream_prefix="test")
+    bus._redis = _FakeRedis(ResponseError("BUSYGROUP Consumer Group name already exists"))  # type: ignore[assignment]
+    assert bus.consume("topic.a", consumer_group="g", consumer_name="c", block_ms=0) == []
+
+    bus._redis = _FakeRedis(ResponseError("WRONGTYPE Operation against a key"))  # type: ignore[assignment]
+    with pytest.raises(ResponseError):
+        bus.consume("topic.b", consumer_group="g", consumer_name="c", block_ms=0)
+
+
+def test_publish_model_matches_dict_payload_shape() -> None:
+    event = TurnProcessedEvent(tenant_id="t", session_id="s", turn_id="turn_1", status=AsyncJobStatus.COMPLETED)
+    expected = {"tenant_id": "t", "session_id": "s", "turn_id": "turn_1", "status": "completed"}
+
+    memory_bus = InMemoryEventBus()
+    memory_bus.publish_model("topic.a", event, key="turn_1")
+    [message] = memory_bus.consume("topic.a", consumer_group="g", consumer_name="c", block_ms=0)
+    assert message.payload == expected
+
+    redis_bus = RedisStreamEventBus(redis_url="redis://127.0.0.1:6379/0", stream_prefix="test")
+    fake = _FakeRedis()
+    redis_bus._redis = fake  # type: ignore[assignment]
+    redis_bus.publish_model("topic.a", event, key="turn_1")
+    name, fields = fake.added
+    assert name == "test:topic.a"
+    assert fields["key"] == "turn_1"
+    assert orjson.loads(fields["payload"]) == expected
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from app.common.config import Settings
+from app.common.schemas import Concept, GraphUpsertRequest, Relation, RelationType
+from app.services.graph import repository
+from app.services.graph.repository import MemoryGraphRepository, build_graph_repository
+
+
+def test_memory_repository_merges_aliases_and_evidence_sorted() -> None:
+    repository = MemoryGraphRepository()
+    first = Concept(canonical_name="Entropy", aliases=["S", "disorder"], evidence_turn_ids=["turn_b"])
+    other = Concept(canonical_name="Heat", evidence_turn_ids=["turn_b"])
+    relation = Relation(
+        source_node_id=first.node_id,
+        target_node_id=other.node_id,
+        relation_type=RelationType.CAUSAL,
+        evidence_turn_ids=["turn_b"],
+    )
+    repository.upsert(
+        GraphUpsertRequest(session_id="sess_1", concepts=[first, other], relations=[relation])
+    )
+
+    again = Concept(canonical_name=" entropy ", aliases=["disorder", "Entropie"], evidence_turn_ids=["turn_a"])
+    heat = Concept(canonical_name="heat", evidence_turn_ids=["turn_a"])
+    response = repository.upsert(
+        GraphUpsertRequest(
+            session_id="sess_1",
+            concepts=[again, heat],
+            relations=[
+                Relation(
+                    source_node_id=again.node_id,
+                    target_node_id=heat.node_id,
+                    relation_type=RelationType.CAUSAL,
+                    evidence_turn_ids=["turn_a"],
+                )
+            ],
+        )
+    )
+
+    assert (response.added_nodes, response.merged_nodes) == (0, 2)
+    assert (response.added_edges, response.merged_edges) == (0, 1)
+
+    snapshot = repository.get_snapshot("public", "sess_1")
+    assert snapshot is not None
+    entropy = next(concept for concept in snapshot.concepts if concept.node_id == first.node_id)
+    assert entropy.aliases == ["Entropie", "S", "disorder"]
+    assert entropy.evidence_turn_ids == ["turn_a", "turn_b"]
+    assert snapshot.relations[0].evidence_turn_ids == ["turn_a", "turn_b"]
+    assert repository.get_snapshot("public", "missing") is None
+
+
+def test_memory_repository_snapshot_is_cached_until_next_upsert() -> None:
+    repository = MemoryGraphRepository()
+    repository.upsert(GraphUpsertRequest(session_id="sess_1", concepts=[Concept(canonical_name="Entropy")]))
+
+    first = repository.get_snapshot("public", "sess_1")
+    assert repository.get_snapshot("public", "sess_1") is first
+
+    repository.upsert(GraphUpsertRequest(session_id="sess_1", concepts=[Concept(canonical_name="Heat")]))
+    refreshed = repository.get_snapshot("public", "sess_1")
+    assert refreshed is not first
+    assert refreshed is not None and len(refreshed.concepts) == 2
+
+
+def test_unreachable_neo4j_falls_back_to_memory_repository(monkeypatch) -> None:
+    monkeypatch.setenv("GRAPH_BACKEND", "neo4j")
+    monkeypatch.setenv("NEO4J_URI", "bolt://127.0.0.1:1")
+    monkeypatch.setenv("ELASTICSEARCH_URL", "http://127.0.0.1:1")
+    try:
+        Settings.reload()
+        assert isinstance(build_graph_repository.__wrapped__(), MemoryGraphRepository)
+    finally:
+        monkeypatch.undo()
+        Settings.reload()
+
+
+class _FakeResult(list):
+    def consume(self) -> None:
+        return None
+
+
+class _FakeSession:
+    def __enter__(self) -> "_FakeSession":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+    def begin_transaction(self) -> "_FakeSession":
+        return self
+
+    def run(self, query: str, **params: object) -> _FakeResult:
+        concepts = params.get("concepts") or []
+        return _FakeResult({"input_id": c["node_id"], "node_id": c["node_id"], "created": True} for c in concepts)
+
+
+class _FakeDriver:
+    def __init__(self) -> None:
+        self.closed = False
+
+    def verify_connectivity(self) -> None:
+        return None
+
+    def session(self) -> _FakeSession:
+        assert not self.closed
+        return _FakeSession()
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_neo4j_repository_reopens_after_close_and_logs_bulk_errors(monkeypatch, caplog) -> None:
+    drivers: list[_FakeDriver] = []
+    bulked: list[int] = []
+
+    def fake_driver(*args: object, **kwargs: object) -> _FakeDriver:
+        drivers.append(_FakeDriver())
+        return drivers[-1]
+
+    def fake_bulk(client: object, actions: list[object], **kwargs: object) -> tuple[int, list[object]]:
+        bulked.append(len(actions))
+        return len(actions) - 1, [{"index": {"status": 400}}]
+
+    monkeypatch.setattr(repository, "GraphDatabase", SimpleNamespace(driver=fake_driver))
+    monkeypatch.setattr(repository, "Elasticsearch", lambda *args, **kwargs: SimpleNamespace(indices=None))
+    monkeypatch.setattr(repository, "helpers", SimpleNamespace(bulk=fake_bulk))
+    repo = repository.Neo4jElasticsearchRepository()
+
+    for _ in range(2):
+        repo.upsert(GraphUpsertRequest(session_id="sess_1", concepts=[Concept(canonical_name="Entropy")]))
+        repo.close()
+
+    assert len(drivers) == 2 and all(driver.closed for driver in drivers)
+    assert bulked == [1, 1]
+    assert "es_bulk_partial indexed=0 errors=1" in caplog.text
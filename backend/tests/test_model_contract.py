@@ -29,3 +29,29 @@ def test_mock_transformer_respects_contract() -> None:
     assert response.status_code == 200
     parsed = TransformerParseResponse.model_validate(response.json())
     assert parsed.concepts
+
+
+def test_mock_transformer_caps_unique_concepts() -> None:
+    client = TestClient(app)
+    content = "alpha alpha beta gamma delta alpha epsilon zeta etaa theta iota kappa " * 50
+    response = client.post(
+        "/v1/infer/parse-turn",
+        json={
+            "tenant_id": "public",
+            "session_id": "sess_demo",
+            "turn": {
+                "turn_id": "turn_1",
+                "tenant_id": "public",
+                "session_id": "sess_demo",
+                "speaker": "user",
+                "content": content,
+                "parent_turn_id": None,
+                "created_at": "2026-01-01T00:00:00Z",
+            },
+            "history": [],
+        },
+    )
+
+    assert response.status_code == 200
+    names = [concept["canonical_name"] for concept in response.json()["concepts"]]
+    assert names == ["alpha", "beta", "gamma", "delta", "epsilon", "zeta", "etaa", "theta"]
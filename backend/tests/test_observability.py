@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.common.observability import install_request_metrics_middleware
+
+
+def _client() -> TestClient:
+    app = FastAPI()
+    install_request_metrics_middleware(app)
+
+    @app.get("/ping")
+    def ping() -> dict[str, str]:
+        return {"status": "ok"}
+
+    return TestClient(app)
+
+
+def test_request_ids_are_generated_unique_and_echoed() -> None:
+    client = _client()
+
+    generated = {client.get("/ping").headers["X-Request-ID"] for _ in range(3)}
+    echoed = client.get("/ping", headers={"X-Request-ID": "req-123"})
+
+    assert len(generated) == 3
+    assert echoed.headers["X-Request-ID"] == "req-123"
+    assert float(echoed.headers["X-Process-Time-MS"]) >= 0
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from app.common.schemas import GapType, ParseTurnRequest, RelationType, Speaker, Turn
+from app.services.parser.backends import HeuristicParserBackend
+
+
+def _request(content: str, session_id: str = "sess_1") -> ParseTurnRequest:
+    turn = Turn(session_id=session_id, speaker=Speaker.USER, content=content)
+    return ParseTurnRequest(session_id=session_id, turn=turn)
+
+
+def test_heuristic_parser_extracts_concepts_and_relation() -> None:
+    backend = HeuristicParserBackend()
+
+    parsed = backend.parse_turn(_request("Gradient Descent converges because the learning rate decays."))
+
+    names = [concept.canonical_name for concept in parsed.concepts]
+    assert names == ["Gradient Descent", "Gradient", "Descent", "converges", "because", "learning", "decays"]
+    assert parsed.relations[0].relation_type == RelationType.CAUSAL
+    assert all(concept.evidence_turn_ids == [parsed.turn_id] for concept in parsed.concepts)
+
+
+def test_heuristic_parser_resolves_pronouns_from_session_memory() -> None:
+    backend = HeuristicParserBackend()
+
+    unresolved = backend.parse_turn(_request("Why does it matter?"))
+    assert [gap.gap_type for gap in unresolved.knowledge_gaps] == [
+        GapType.AMBIGUOUS_REFERENCE,
+        GapType.MISSING_PREREQUISITE,
+    ]
+
+    backend.parse_turn(_request("Backpropagation computes gradients."))
+    resolved = backend.parse_turn(_request("Why does it matter?"))
+    assert [(c.mention, c.resolved_to) for c in resolved.coreferences] == [("it", "gradients")]
+    assert GapType.AMBIGUOUS_REFERENCE not in {gap.gap_type for gap in resolved.knowledge_gaps}
+
+
+def test_heuristic_parser_evicts_least_recent_session_memory() -> None:
+    backend = HeuristicParserBackend(session_memory_max=2)
+
+    backend.parse_turn(_request("Backpropagation computes gradients.", session_id="sess_a"))
+    backend.parse_turn(_request("Entropy measures disorder.", session_id="sess_b"))
+    backend.parse_turn(_request("Why does it matter?", session_id="sess_a"))
+    backend.parse_turn(_request("Attention weighs tokens.", session_id="sess_c"))
+
+    assert list(backend.session_concept_memory) == ["public:sess_a", "public:sess_c"]
@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+from fastapi.testclient import TestClient
+
+from app.common.schemas import ParseTurnRequest, RelationType, Speaker, Turn
+from app.services.model_inference.main import app as model_app
+from app.services.parser.backends import TransformerInferenceParserBackend
+
+
+def _backend(*hooks, **kwargs) -> TransformerInferenceParserBackend:
+    backend = TransformerInferenceParserBackend(
+        inference_url="http://testserver/v1/infer/parse-turn",
+        timeout_seconds=2.0,
+        **kwargs,
+    )
+    backend._client = TestClient(model_app)
+    backend._new_async_client = lambda: httpx.AsyncClient(  # type: ignore[method-assign]
+        transport=httpx.ASGITransport(app=model_app), event_hooks={"request": list(hooks)}
+    )
+    return backend
+
+
+def _request(content: str) -> ParseTurnRequest:
+    turn = Turn(session_id="sess_1", speaker=Speaker.USER, content=content)
+    return ParseTurnRequest(session_id="sess_1", turn=turn)
+
+
+def test_transformer_backend_maps_model_output() -> None:
+    backend = _backend()
+
+    parsed = backend.parse_turn(_request("Transformers improve search because they encode context."))
+
+    assert [concept.canonical_name for concept in parsed.concepts][:2] == ["Transformers", "improve"]
+    assert parsed.relations[0].relation_type == RelationType.CAUSAL
+    assert parsed.relations[0].source_node_id == parsed.concepts[0].node_id
+    assert all(concept.confidence == 0.84 for concept in parsed.concepts)
+
+
+def test_transformer_backend_falls_back_without_concepts() -> None:
+    backend = _backend()
+
+    parsed = backend.parse_turn(_request("ok"))
+
+    assert parsed.concepts == []
+    assert parsed.turn_id
+
+
+def test_transformer_backend_parses_asynchronously() -> None:
+    backend = _backend()
+
+    async def run() -> list[tuple[str, float]]:
+        try:
+            parsed = await backend.parse_turn_async(_request("Transformers improve search because they encode context."))
+            return [(concept.canonical_name, concept.confidence) for concept in parsed.concepts]
+        finally:
+            await backend.aclose()
+
+    assert asyncio.run(run())[:2] == [("Transformers", 0.84), ("improve", 0.84)]
+
+
+def test_transformer_backend_micro_batches_concurrent_turns() -> None:
+    posted: list[str] = []
+
+    async def record(request: httpx.Request) -> None:
+        posted.append(request.url.path)
+
+    backend = _backend(record, batch_max=8, batch_window_ms=20)
+    contents = ["Gradient descent converges.", "Entropy measures disorder.", "Attention weighs tokens."]
+
+    async def run() -> list[list[str]]:
+        try:
+            results = await asyncio.gather(*(backend.parse_turn_async(_request(text)) for text in contents))
+            return [[concept.canonical_name for concept in parsed.concepts] for parsed in results]
+        finally:
+            await backend.aclose()
+
+    assert asyncio.run(run()) == [
+        ["Gradient", "descent", "converges"],
+        ["Entropy", "measures", "disorder"],
+        ["Attention", "weighs", "tokens"],
+    ]
+    assert posted == ["/v1/infer/parse-turn-batch"]
+
+
+def test_transformer_backend_skips_malformed_items_and_rejects_non_objects() -> None:
+    backend = _backend()
+    bodies = iter(
+        [
+            b'{"concepts": [{"canonical_name": "Entropy", "aliases": [" S ", " ", 7]}, "junk", {"canonical_name": " "}],'
+            b' "relations": null}',
+            b'{"concepts": [{"canonical_name": "Heat", "aliases": "foo"}]}',
+            b"[]",
+        ]
+    )
+    backend._client = httpx.Client(transport=httpx.MockTransport(lambda _: httpx.Response(200, content=next(bodies))))
+
+    partial = backend.parse_turn(_request("Entropy measures disorder."))
+    scalar_aliases = backend.parse_turn(_request("Heat flows."))
+    rejected = backend.parse_turn(_request("Entropy measures heat flow."))
+
+    assert [(c.canonical_name, c.confidence, c.aliases) for c in partial.concepts] == [("Entropy", 0.8, ["S", "7"])]
+    assert [(c.canonical_name, c.aliases) for c in scalar_aliases.concepts] == [("Heat", [])]
+    assert {c.confidence for c in rejected.concepts} == {0.58}
+
+
+def test_transformer_backend_skips_items_with_malformed_numbers() -> None:
+    backend = _backend()
+    extracted = {
+        "concepts": [
+            {"canonical_name": "Entropy", "domain": None, "confidence": None},
+            {"canonical_name": "Heat", "confidence": "high"},
+            {"canonical_name": "Disorder", "confidence": "0.6"},
+            {"canonical_name": None},
+        ],
+        "relations": [
+            {"source": "entropy", "target": "disorder", "relation_type": "causal", "confidence": "high"},
+            {"source": "entropy", "target": "disorder", "relation_type": "causal", "confidence": 0.9},
+        ],
+        "coreferences": [
+            {"mention": "it", "resolved_to": "Entropy", "confidence": None},
+            {"mention": "that", "resolved_to": "Heat", "confidence": []},
+        ],
+        "knowledge_gaps": [
+            {"gap_type": "missing_prerequisite", "priority": "urgent"},
+            {"gap_type": "missing_prerequisite", "priority": 3.0, "description": None},
+        ],
+    }
+
+    parsed = backend._map_model_output(_request("Entropy measures disorder."), extracted)
+
+    assert [(c.canonical_name, c.domain, c.confidence) for c in parsed.concepts] == [
+        ("Entropy", "general", 0.8),
+        ("Disorder", "general", 0.6),
+    ]
+    assert [r.confidence for r in parsed.relations] == [0.9]
+    assert [(c.mention, c.confidence) for c in parsed.coreferences] == [("it", 0.75)]
+    assert [(g.priority, g.description) for g in parsed.knowledge_gaps] == [(3, "Model-signaled knowledge gap.")]
+
+
+def test_transformer_backend_reuses_cached_output_across_sessions() -> None:
+    backend = _backend(cache_enabled=True)
+    posted: list[str] = []
+    body = b'{"concepts": [{"canonical_name": "Entropy"}], "relations": []}'
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        posted.append(request.url.path)
+        return httpx.Response(200, content=body)
+
+    backend._client = httpx.Client(transport=httpx.MockTransport(respond))
+
+    def request(session_id: str, content: str, previous: str) -> ParseTurnRequest:
+        history = [Turn(session_id=session_id, speaker=Speaker.USER, content=previous)]
+        turn = Turn(session_id=session_id, speaker=Speaker.USER, content=content)
+        return ParseTurnRequest(session_id=session_id, turn=turn, history=history)
+
+    first = backend.parse_turn(request("sess_a", "Entropy measures disorder.", "Heat flows."))
+    again = backend.parse_turn(request("sess_b", "Entropy measures disorder.", "Gradients vanish."))
+
+    assert len(posted) == 1
+    assert [c.canonical_name for c in again.concepts] == ["Entropy"]
+    assert again.session_id == "sess_b"
+    assert again.concepts[0].node_id != first.concepts[0].node_id
+    assert again.concepts[0].evidence_turn_ids == [again.turn_id]
+
+    # A pronoun makes the previous turn part of the key.
+    backend.parse_turn(request("sess_a", "Why does it matter?", "Heat flows."))
+    backend.parse_turn(request("sess_b", "Why does it matter?", "Gradients vanish."))
+    backend.parse_turn(request("sess_c", "Why does it matter?", "Heat flows."))
+    assert len(posted) == 3
+
+    backend.cache_enabled = False
+    backend.parse_turn(request("sess_a", "Entropy measures disorder.", "Heat flows."))
+    assert len(posted) == 4
+
+
+def test_transformer_backend_does_not_cache_output_that_fails_to_map(monkeypatch) -> None:
+    backend = _backend(cache_enabled=True)
+    posted: list[str] = []
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        posted.append(request.url.path)
+        return httpx.Response(200, content=b'{"concepts": [{"canonical_name": "Entropy"}]}')
+
+    backend._client = httpx.Client(transport=httpx.MockTransport(respond))
+    mapper = backend._map_model_output
+
+    def fail_once(payload: ParseTurnRequest, extracted: dict) -> object:
+        monkeypatch.setattr(backend, "_map_model_output", mapper)
+        raise ValueError("unmappable")
+
+    monkeypatch.setattr(backend, "_map_model_output", fail_once)
+
+    fallback = backend.parse_turn(_request("Entropy measures disorder."))
+    mapped = backend.parse_turn(_request("Entropy measures disorder."))
+    cached = backend.parse_turn(_request("Entropy measures disorder."))
+
+    assert {c.confidence for c in fallback.concepts} == {0.58}
+    assert [c.canonical_name for c in mapped.concepts] == [c.canonical_name for c in cached.concepts] == ["Entropy"]
+    assert len(posted) == 2
+
+
+def test_transformer_backend_batches_on_each_event_loop() -> None:
+    backend = _backend(batch_max=8, batch_window_ms=5)
+
+    async def run(text: str) -> list[str]:
+        parsed = await backend.parse_turn_async(_request(text))
+        # 0.84 is the model's confidence; the heuristic fallback would report 0.58.
+        return [concept.canonical_name for concept in parsed.concepts if concept.confidence == 0.84]
+
+    async def run_and_close(text: str) -> list[str]:
+        try:
+            return await run(text)
+        finally:
+            await backend.aclose()
+
+    assert asyncio.run(run("Entropy measures disorder.")) == ["Entropy", "measures", "disorder"]
+    assert asyncio.run(run("Attention weighs tokens.")) == ["Attention", "weighs", "tokens"]
+    assert asyncio.run(run_and_close("Gradient descent converges.")) == ["Gradient", "descent", "converges"]
+    assert backend._batch_queue is None and backend._batch_task is None and backend._aclient is None
+
+
+def test_transformer_backend_builds_its_async_client_inside_the_running_loop() -> None:
+    backend = TransformerInferenceParserBackend(inference_url="http://testserver/v1/infer/parse-turn", timeout_seconds=2.0)
+    assert backend._aclient is None and backend._client is None
+
+    async def run() -> None:
+        first = await backend._bind_loop()
+        assert await backend._bind_loop() is first
+        await backend.aclose()
+        assert first.is_closed and backend._aclient is None
+
+        reopened = await backend._bind_loop()
+        assert reopened is not first and not reopened.is_closed
+        await backend.aclose()
+
+    asyncio.run(run())
+
+
+def test_transformer_backend_closes_the_client_of_a_finished_loop() -> None:
+    backend = _backend()
+
+    async def parse() -> httpx.AsyncClient:
+        await backend.parse_turn_async(_request("Entropy measures disorder."))
+        assert backend._aclient is not None
+        return backend._aclient
+
+    first = asyncio.run(parse())
+    assert first.is_closed
+
+    second = asyncio.run(parse())
+    assert second is not first and second.is_closed
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from app.common.persistence import MemorySessionStore, RedisJobStore, TurnMetadata
+from app.common.schemas import AsyncJobStatus, AsyncTurnJobResponse, Session, Speaker, Turn
+
+
+def _turn(content: str, session_id: str = "sess_demo") -> Turn:
+    return Turn(tenant_id="public", session_id=session_id, speaker=Speaker.USER, content=content)
+
+
+def test_memory_append_turns_preserves_order() -> None:
+    store = MemorySessionStore()
+    store.create_session(Session(session_id="sess_demo", tenant_id="public", user_id="u_1"))
+    turns = [_turn(f"turn {i}") for i in range(3)]
+
+    store.append_turns([(turn, turn.content.encode("utf-8")) for turn in turns])
+
+    rows = store.list_turns(tenant_id="public", session_id="sess_demo")
+    assert [row.turn_id for row in rows] == [turn.turn_id for turn in turns]
+    assert [row.content_ciphertext for row in rows] == [b"turn 0", b"turn 1", b"turn 2"]
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+
+    def set(self, key, value, ex=None):  # type: ignore[no-untyped-def]
+        del ex
+        self.values[key] = value.decode() if isinstance(value, bytes) else value
+
+    def get(self, key):  # type: ignore[no-untyped-def]
+        return self.values.get(key)
+
+
+def test_redis_job_store_round_trips_jobs() -> None:
+    store = RedisJobStore.__new__(RedisJobStore)
+    store._redis = _FakeRedis()
+    store._ttl_seconds = 60
+    store._prefix = "test:job"
+    job = AsyncTurnJobResponse(
+        job_id="job_1",
+        tenant_id="public",
+        session_id="sess_demo",
+        turn_id="turn_1",
+        status=AsyncJobStatus.QUEUED,
+    )
+
+    store.create_job(job)
+    store.upsert_job(job.model_copy(update={"status": AsyncJobStatus.COMPLETED}))
+
+    assert store.get_job("job_1") == job.model_copy(update={"status": AsyncJobStatus.COMPLETED})
+    assert store.get_job("job_missing") is None
+
+
+def test_memory_list_turns_limit_returns_latest_window_in_order() -> None:
+    store = MemorySessionStore()
+    store.create_session(Session(session_id="sess_demo", tenant_id="public", user_id="u_1"))
+    turns = [_turn(f"turn {i}") for i in range(5)]
+    store.append_turns([(turn, turn.content.encode("utf-8")) for turn in turns])
+
+    window = store.list_turns(tenant_id="public", session_id="sess_demo", limit=2)
+
+    assert [row.turn_id for row in window] == [turns[3].turn_id, turns[4].turn_id]
+    assert len(store.list_turns(tenant_id="public", session_id="sess_demo", limit=10)) == 5
+    assert store.list_turns(tenant_id="public", session_id="sess_demo", limit=0) == []
+
+
+def test_memory_list_turn_metadata_skips_content() -> None:
+    store = MemorySessionStore()
+    store.create_session(Session(session_id="sess_demo", tenant_id="public", user_id="u_1"))
+    first = _turn("first")
+    second = Turn(
+        tenant_id="public",
+        session_id="sess_demo",
+        speaker=Speaker.ASSISTANT,
+        content="second",
+        parent_turn_id=first.turn_id,
+    )
+    store.append_turns([(first, b"c1"), (second, b"c2")])
+
+    metadata = store.list_turn_metadata(tenant_id="public", session_id="sess_demo")
+
+    assert metadata == [
+        TurnMetadata(turn_id=first.turn_id, speaker=Speaker.USER, parent_turn_id=None),
+        TurnMetadata(turn_id=second.turn_id, speaker=Speaker.ASSISTANT, parent_turn_id=first.turn_id),
+    ]
+
+
+def test_memory_list_turn_window_ends_at_requested_turn() -> None:
+    store = MemorySessionStore()
+    turns = [_turn(f"turn {i}") for i in range(5)]
+    store.append_turns([(turn, turn.content.encode("utf-8")) for turn in turns])
+
+    window = store.list_turn_window(tenant_id="public", session_id="sess_demo", turn_id=turns[3].turn_id, limit=2)
+
+    assert [row.turn_id for row in window] == [turns[1].turn_id, turns[2].turn_id, turns[3].turn_id]
+    assert store.list_turn_window(tenant_id="public", session_id="sess_demo", turn_id="turn_missing", limit=2) == []
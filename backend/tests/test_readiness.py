@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+from app.common.readiness import gather_checks, run_checks_parallel
+
+
+def _slow_probe(result: tuple[bool, str]):  # type: ignore[no-untyped-def]
+    def probe() -> tuple[bool, str]:
+        time.sleep(0.2)
+        return result
+
+    return probe
+
+
+def _failing_probe() -> tuple[bool, str]:
+    raise RuntimeError("boom")
+
+
+def test_run_checks_parallel_overlaps_probes_and_keeps_order() -> None:
+    probes = {
+        "a": _slow_probe((True, "a ok")),
+        "b": _slow_probe((False, "b down")),
+        "c": _slow_probe((True, "c ok")),
+    }
+
+    started = time.perf_counter()
+    checks = run_checks_parallel(probes)
+    elapsed = time.perf_counter() - started
+
+    assert list(checks) == ["a", "b", "c"]
+    assert checks["b"] == (False, "b down")
+    assert elapsed < 0.5
+
+
+def test_gather_checks_reports_probe_errors() -> None:
+    checks = asyncio.run(gather_checks({"ok": lambda: (True, "fine"), "bad": _failing_probe}))
+
+    assert checks["ok"] == (True, "fine")
+    assert checks["bad"][0] is False
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import time
+
 import jwt
 import pytest
 from fastapi import HTTPException
 
 from app.common.config import settings
-from app.common.security import get_tenant_context
+from app.common.security import get_tenant_context, reload_auth_config
 
 
 def test_jwt_auth_resolves_tenant_and_subject() -> None:
@@ -18,6 +20,7 @@ def test_jwt_auth_resolves_tenant_and_subject() -> None:
         settings.jwt_secret = "unit-test-secret"
         settings.jwt_audience = None
         settings.jwt_issuer = None
+        reload_auth_config()
         token = jwt.encode({"sub": "u_1", "tenant_id": "acme"}, settings.jwt_secret, algorithm=settings.jwt_algorithm)
 
         ctx = get_tenant_context(x_tenant_id="acme", x_api_key=None, authorization=f"Bearer {token}")
@@ -29,6 +32,7 @@ def test_jwt_auth_resolves_tenant_and_subject() -> None:
         settings.jwt_secret = old_secret
         settings.jwt_audience = old_audience
         settings.jwt_issuer = old_issuer
+        reload_auth_config()
 
 
 def test_jwt_auth_rejects_header_mismatch() -> None:
@@ -41,6 +45,7 @@ def test_jwt_auth_rejects_header_mismatch() -> None:
         settings.jwt_secret = "unit-test-secret"
         settings.jwt_audience = None
         settings.jwt_issuer = None
+        reload_auth_config()
         token = jwt.encode({"sub": "u_1", "tenant_id": "acme"}, settings.jwt_secret, algorithm=settings.jwt_algorithm)
         with pytest.raises(HTTPException):
             get_tenant_context(x_tenant_id="other", x_api_key=None, authorization=f"Bearer {token}")
@@ -49,3 +54,58 @@ def test_jwt_auth_rejects_header_mismatch() -> None:
         settings.jwt_secret = old_secret
         settings.jwt_audience = old_audience
         settings.jwt_issuer = old_issuer
+        reload_auth_config()
+
+
+def test_jwt_cache_reverifies_once_token_expiry_passes(monkeypatch) -> None:
+    old_mode = settings.auth_mode
+    old_secret = settings.jwt_secret
+    old_audience = settings.jwt_audience
+    old_issuer = settings.jwt_issuer
+    try:
+        settings.auth_mode = "jwt"
+        settings.jwt_secret = "unit-test-secret"
+        settings.jwt_audience = None
+        settings.jwt_issuer = None
+        reload_auth_config()
+        now = time.time()
+        token = jwt.encode(
+            {"sub": "u_1", "tenant_id": "acme", "exp": int(now) + 60},
+            settings.jwt_secret,
+            algorithm=settings.jwt_algorithm,
+        )
+        decode_calls = {"count": 0}
+        real_decode = jwt.decode
+
+        def counting_decode(*args, **kwargs):  # type: ignore[no-untyped-def]
+            decode_calls["count"] += 1
+            return real_decode(*args, **kwargs)
+
+        monkeypatch.setattr(jwt, "decode", counting_decode)
+        for _ in range(3):
+            get_tenant_context(x_tenant_id="acme", x_api_key=None, authorization=f"Bearer {token}")
+        assert decode_calls["count"] == 1
+
+        monkeypatch.setattr(time, "time", lambda: now + 120)
+        get_tenant_context(x_tenant_id="acme", x_api_key=None, authorization=f"Bearer {token}")
+        assert decode_calls["count"] == 2
+    finally:
+        settings.auth_mode = old_mode
+        settings.jwt_secret = old_secret
+        settings.jwt_audience = old_audience
+        settings.jwt_issuer = old_issuer
+        reload_auth_config()
+
+
+@pytest.mark.parametrize("authorization", [None, "", "Basic abc", "Bearertoken", "bear"])
+def test_jwt_auth_requires_bearer_prefix(authorization: str | None) -> None:
+    old_mode = settings.auth_mode
+    try:
+        settings.auth_mode = "jwt"
+        reload_auth_config()
+        with pytest.raises(HTTPException) as exc_info:
+            get_tenant_context(x_tenant_id="acme", x_api_key=None, authorization=authorization)
+        assert exc_info.value.detail == "Missing bearer token"
+    finally:
+        settings.auth_mode = old_mode
+        reload_auth_config()